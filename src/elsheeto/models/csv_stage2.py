@@ -30,7 +30,7 @@ class HeaderSection(BaseModel):
         result = {}
         for row in self.rows:
             # Filter out empty cells
-            non_empty_cells = [cell.strip() for cell in row if cell.strip()]
+            non_empty_cells = [stripped for cell in row if (stripped := cell.strip())]
             # Only treat rows with exactly 2 non-empty cells as key-value pairs
             if len(non_empty_cells) == 2:
                 result[non_empty_cells[0]] = non_empty_cells[1]
@@ -22,6 +22,39 @@ from elsheeto.parser.common import ParserConfiguration
 #: The module logger.
 LOGGER = logging.getLogger(__name__)
 
+#: Mapping from lower-case ``[Header]`` keys to ``IlluminaHeader`` fields.
+_HEADER_FIELD_MAPPING: dict[str, str] = {
+    "iemfileversion": "iem_file_version",
+    "investigator name": "investigator_name",
+    "experiment name": "experiment_name",
+    "date": "date",
+    "workflow": "workflow",
+    "application": "application",
+    "instrument type": "instrument_type",
+    "assay": "assay",
+    "index adapters": "index_adapters",
+    "description": "description",
+    "chemistry": "chemistry",
+    "run": "run",
+}
+
+#: Mapping from lower-case ``[Data]`` column headers to ``IlluminaSample`` fields.
+_DATA_FIELD_MAPPING: dict[str, str] = {
+    "lane": "lane",
+    "sample_id": "sample_id",
+    "sample_name": "sample_name",
+    "sample_plate": "sample_plate",
+    "sample_well": "sample_well",
+    "index_plate_well": "index_plate_well",
+    "inline_id": "inline_id",
+    "i7_index_id": "i7_index_id",
+    "index": "index",
+    "i5_index_id": "i5_index_id",
+    "index2": "index2",
+    "sample_project": "sample_project",
+    "description": "description",
+}
+
 
 class Parser:
     """Stage 3 parser for Illumina v1 sample sheets.
@@ -86,7 +119,6 @@ class Parser:
         Returns:
             Parsed IlluminaHeader.
         """
-        header_data = {}
         extra_metadata = {}
 
         # Find the "header" section by name
@@ -115,35 +147,12 @@ class Parser:
                 extra_metadata=CaseInsensitiveDict({}),
             )
 
-        # Extract key-value pairs from header section
-        for row in header_section.rows:
-            # Filter out empty cells
-            non_empty_cells = [cell.strip() for cell in row if cell.strip()]
-            # Only treat rows with exactly 2 non-empty cells as key-value pairs
-            if len(non_empty_cells) == 2:
-                header_data[non_empty_cells[0]] = non_empty_cells[1]
-
         # Map known fields with case-insensitive matching
-        field_mapping = {
-            "iemfileversion": "iem_file_version",
-            "investigator name": "investigator_name",
-            "experiment name": "experiment_name",
-            "date": "date",
-            "workflow": "workflow",
-            "application": "application",
-            "instrument type": "instrument_type",
-            "assay": "assay",
-            "index adapters": "index_adapters",
-            "description": "description",
-            "chemistry": "chemistry",
-            "run": "run",
-        }
-
         mapped_data = {}
-        for key, value in header_data.items():
-            key_lower = key.lower()
-            if key_lower in field_mapping:
-                mapped_data[field_mapping[key_lower]] = value
+        for key, value in header_section.key_values.items():
+            model_field = _HEADER_FIELD_MAPPING.get(key.lower())
+            if model_field is not None:
+                mapped_data[model_field] = value
             else:
                 extra_metadata[key] = value
 
@@ -175,8 +184,8 @@ class Parser:
         read_lengths = []
         for row in reads_section.rows:
             try:
-                # Filter out empty cells
-                non_empty_cells = [cell.strip() for cell in row if cell.strip()]
+                # Filter out empty cells, stripping each cell only once
+                non_empty_cells = [stripped for cell in row if (stripped := cell.strip())]
 
                 if len(non_empty_cells) == 1:
                     # Handle format like "151" (single read length value)
@@ -230,50 +239,22 @@ class Parser:
             return []
 
         samples = []
-        headers = data_section.headers
-
-        # Create header mapping for case-insensitive lookup
-        {header.lower(): header for header in headers}
-
-        # Field mapping from CSV headers to model fields
-        field_mapping = {
-            "lane": "lane",
-            "sample_id": "sample_id",
-            "sample_name": "sample_name",
-            "sample_plate": "sample_plate",
-            "sample_well": "sample_well",
-            "index_plate_well": "index_plate_well",
-            "inline_id": "inline_id",
-            "i7_index_id": "i7_index_id",
-            "index": "index",
-            "i5_index_id": "i5_index_id",
-            "index2": "index2",
-            "sample_project": "sample_project",
-            "description": "description",
-        }
+
+        # Resolve each column to its model field (or None for extra metadata) once, not per row
+        columns = [(header, _DATA_FIELD_MAPPING.get(header.lower())) for header in data_section.headers]
 
         for row_idx, row in enumerate(data_section.data):
             try:
                 sample_data = {}
                 extra_metadata = {}
 
-                # Map row data to sample fields
-                for col_idx, value in enumerate(row):
-                    if col_idx >= len(headers):
-                        break
-
-                    header = headers[col_idx]
-                    header_lower = header.lower()
-
-                    # Clean the value
-                    clean_value = value.strip() if value else None
-                    if clean_value == "":
-                        clean_value = None
+                # Map row data to sample fields; values beyond the last header are ignored
+                for (header, model_field), value in zip(columns, row, strict=False):
+                    # Clean the value, empty and whitespace-only values become None
+                    clean_value = value.strip() or None
 
                     # Map to known fields
-                    if header_lower in field_mapping:
-                        model_field = field_mapping[header_lower]
-
+                    if model_field is not None:
                         # Special handling for integer fields
                         if model_field == "lane" and clean_value is not None:
                             try:
@@ -24,6 +24,9 @@ from elsheeto.parser.common import (
 #: The module logger.
 LOGGER = logging.getLogger(__name__)
 
+#: Maximal number of characters from the start of the data used for sniffing the CSV dialect.
+SNIFF_SAMPLE_SIZE = 64 * 1024
+
 
 class Parser:
     """Splitter for sectioned CSV files.
@@ -37,6 +40,10 @@ class Parser:
     def __init__(self, config: ParserConfiguration) -> None:
         """Initialize the splitter with the given configuration."""
         self.config = config
+        #: Comment prefixes as a tuple for a single `str.startswith` call per row.
+        self._comment_prefixes = tuple(config.comment_prefixes)
+        #: Prefixes of lines left out of dialect sniffing; "#" lines are always skipped there.
+        self._sniff_comment_prefixes = tuple(dict.fromkeys(("#", *config.comment_prefixes)))
 
     def parse(self, *, data: str) -> ParsedRawSheet:
         """Parse the given sectioned CSV data into a ParsedRawSheet.
@@ -77,18 +84,21 @@ class Parser:
             A CSV dialect class.
         """
         LOGGER.debug("Sniffing CSV dialect...")
+        sample = self._sniff_sample(data)
 
-        # First, try to sniff from the full data
+        # First, try to sniff from the full sample
         try:
-            dialect = csv.Sniffer().sniff(sample=data, delimiters="".join(self.config.delimiter.candidate_delimiters()))
+            dialect = csv.Sniffer().sniff(
+                sample=sample, delimiters="".join(self.config.delimiter.candidate_delimiters())
+            )
             self._log_dialect(dialect)
             return dialect
         except csv.Error:
-            LOGGER.debug("Failed to sniff dialect from full data, trying data rows only...")
+            LOGGER.debug("Failed to sniff dialect from full sample, trying data rows only...")
 
         # If that fails, try to extract data rows (non-section headers) and sniff from those
         try:
-            data_rows = self._extract_data_rows_for_sniffing(data)
+            data_rows = self._extract_data_rows_for_sniffing(sample)
             if data_rows:
                 dialect = csv.Sniffer().sniff(
                     sample=data_rows, delimiters="".join(self.config.delimiter.candidate_delimiters())
@@ -108,6 +118,22 @@ class Parser:
 
         return FallbackDialect
 
+    def _sniff_sample(self, data: str) -> str:
+        """Return the start of the data used for sniffing the CSV dialect.
+
+        The sample has at most `SNIFF_SAMPLE_SIZE` characters and is cut after the last complete line.
+
+        Args:
+            data: The full CSV data.
+
+        Returns:
+            The sample to sniff from.
+        """
+        if len(data) <= SNIFF_SAMPLE_SIZE:
+            return data
+        sample = data[:SNIFF_SAMPLE_SIZE]
+        return sample[: sample.rfind("\n") + 1] or sample
+
     def _extract_data_rows_for_sniffing(self, data: str) -> str:
         """Extract non-section header rows for dialect sniffing.
 
@@ -117,14 +143,14 @@ class Parser:
         Returns:
             Data rows without section headers for sniffing.
         """
-        lines = data.split("\n")
         data_lines = []
 
-        for line in lines:
+        for line in data.splitlines():
             line = line.strip()
             if not line:
                 continue
-            if line.startswith("#"):  # Skip comments
+            # Skip comments, i.e., "#" lines and lines with a configured comment prefix
+            if line.startswith(self._sniff_comment_prefixes):
                 continue
             if line.startswith("[") and line.endswith("]"):  # Skip section headers
                 continue
@@ -170,17 +196,22 @@ class Parser:
         current_section_name = ""
         current_section_data: list[list[str]] = []
 
+        # Bind the configuration and row classifiers once, outside of the per-row loop
+        ignore_empty_lines = self.config.ignore_empty_lines
+        is_empty_row = self._is_empty_row
+        is_comment_row = self._is_comment_row
+        extract_section_name = self._extract_section_name
         for row in reader:
             # Skip empty lines if configured
-            if self.config.ignore_empty_lines and self._is_empty_row(row):
+            if ignore_empty_lines and is_empty_row(row):
                 continue
 
             # Skip comment lines
-            if self._is_comment_row(row):
+            if is_comment_row(row):
                 continue
 
             # Check if this is a section header
-            section_name = self._extract_section_name(row)
+            section_name = extract_section_name(row)
             if section_name is not None:
                 # Save previous section if it exists
                 if current_section_name or current_section_data:
@@ -205,14 +236,13 @@ class Parser:
 
     def _is_empty_row(self, row: list[str]) -> bool:
         """Check if a row is empty (all cells are empty strings)."""
-        return all(cell.strip() == "" for cell in row)
+        return not any(cell.strip() for cell in row)
 
     def _is_comment_row(self, row: list[str]) -> bool:
         """Check if a row is a comment based on configured prefixes."""
         if not row:
             return False
-        first_cell = row[0].strip()
-        return any(first_cell.startswith(prefix) for prefix in self.config.comment_prefixes)
+        return row[0].strip().startswith(self._comment_prefixes)
 
     def _extract_section_name(self, row: list[str]) -> str | None:
         """Extract section name from a row if it's a section header.
@@ -225,7 +255,7 @@ class Parser:
         Returns:
             Section name if this is a section header, None otherwise.
         """
-        if not row or not row[0].strip():
+        if not row:
             return None
 
         first_cell = row[0].strip()
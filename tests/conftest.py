@@ -0,0 +1,30 @@
+from pathlib import Path
+
+import pytest
+from syrupy.assertion import SnapshotAssertion
+from syrupy.extensions.json import JSONSnapshotExtension
+
+from elsheeto.parser.common import ParserConfiguration
+
+#: Root directory of the test data files.
+DATA_ROOT = Path(__file__).resolve().parent / "data"
+
+
+@pytest.fixture
+def snapshot_json(snapshot: SnapshotAssertion) -> SnapshotAssertion:
+    return snapshot.use_extension(JSONSnapshotExtension)
+
+
+@pytest.fixture(scope="session")
+def parser_config() -> ParserConfiguration:
+    """Default parser configuration, shared by all tests that do not modify it."""
+    return ParserConfiguration()
+
+
+@pytest.fixture(scope="session")
+def data_files() -> dict[str, str]:
+    """Contents of all CSV test data files, keyed by their path relative to `DATA_ROOT`."""
+    return {
+        path.relative_to(DATA_ROOT).as_posix(): path.read_text(encoding="utf-8")
+        for path in sorted(DATA_ROOT.glob("*/*.csv"))
+    }
@@ -0,0 +1,15 @@
+import pytest
+
+import elsheeto.parser.stage1 as stage1
+import elsheeto.parser.stage2 as stage2
+from elsheeto.models.csv_stage2 import ParsedSheet
+from elsheeto.parser.common import ParserConfiguration
+
+
+@pytest.fixture(scope="session")
+def structured_sheet(
+    request: pytest.FixtureRequest, data_files: dict[str, str], parser_config: ParserConfiguration
+) -> ParsedSheet:
+    """Stage 2 result for the data file given as indirect parameter, parsed once per session."""
+    raw_sheet = stage1.from_csv(data=data_files[request.param], config=parser_config)
+    return stage2.from_stage1(raw_sheet=raw_sheet, config=parser_config)
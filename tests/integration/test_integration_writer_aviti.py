@@ -3,7 +3,12 @@
 import tempfile
 from pathlib import Path
 
-from elsheeto.facade import parse_aviti, write_aviti_to_file, write_aviti_to_string
+from elsheeto.facade import (
+    parse_aviti,
+    parse_aviti_from_data,
+    write_aviti_to_file,
+    write_aviti_to_string,
+)
 from elsheeto.models.aviti import AvitiSample, AvitiSheetBuilder
 
 
@@ -250,10 +255,3 @@ Original2,TTTT,AAAA,OriginalProject
         assert parsed_sheet.settings is not None
         setting = parsed_sheet.settings.settings.get_by_key("Comma,Setting")
         assert setting.value == "Value,with,commas"
-
-
-def parse_aviti_from_data(data: str):
-    """Helper function to parse Aviti data from string."""
-    from elsheeto.facade import parse_aviti_from_data as parse_func
-
-    return parse_func(data)
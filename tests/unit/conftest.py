@@ -1,8 +1,10 @@
 import pytest
-from syrupy.assertion import SnapshotAssertion
-from syrupy.extensions.json import JSONSnapshotExtension
 
+from elsheeto.parser.common import ParserConfiguration
+from elsheeto.parser.illumina_v1 import Parser as IlluminaV1Parser
 
-@pytest.fixture
-def snapshot_json(snapshot: SnapshotAssertion) -> SnapshotAssertion:
-    return snapshot.use_extension(JSONSnapshotExtension)
+
+@pytest.fixture(scope="session")
+def illumina_v1_parser(parser_config: ParserConfiguration) -> IlluminaV1Parser:
+    """Illumina v1 parser with default configuration, shared by all unit tests."""
+    return IlluminaV1Parser(parser_config)
@@ -0,0 +1,46 @@
+"""Helpers for building stage 2 sheets as input to the stage 3 parser unit tests."""
+
+import functools
+
+from elsheeto.models.common import ParsedSheetType
+from elsheeto.models.csv_stage2 import (
+    DataSection,
+    HeaderSection,
+    ParsedSheet,
+)
+
+#: Shared empty default for helper arguments; must not be mutated.
+_EMPTY: list = []
+
+#: Empty data section, shared by all sheets built without sample data.
+_EMPTY_DATA_SECTION = DataSection.model_construct()
+
+
+@functools.lru_cache(maxsize=64)
+def _header_to_index(headers: tuple[str, ...]) -> dict[str, int]:
+    """Build the header to index map, shared between calls with the same headers."""
+    return {header: idx for idx, header in enumerate(headers)}
+
+
+def create_data_section(headers: list[str] | None = None, data: list[list[str]] | None = None) -> DataSection:
+    """Create a DataSection from trusted test input, skipping validation."""
+    headers = _EMPTY if headers is None else headers
+    data = _EMPTY if data is None else data
+    return DataSection.model_construct(headers=headers, header_to_index=_header_to_index(tuple(headers)), data=data)
+
+
+def create_parsed_sheet(
+    header_sections: list[HeaderSection] | None = None,
+    data_section: DataSection | None = None,
+    delimiter: str = ",",
+    sheet_type: ParsedSheetType = ParsedSheetType.SECTIONED,
+) -> ParsedSheet:
+    """Create a ParsedSheet from trusted test input, skipping validation."""
+    header_sections = _EMPTY if header_sections is None else header_sections
+    data_section = _EMPTY_DATA_SECTION if data_section is None else data_section
+    return ParsedSheet.model_construct(
+        delimiter=delimiter,
+        sheet_type=sheet_type,
+        header_sections=header_sections,
+        data_section=data_section,
+    )
@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+import pytest
+
 from elsheeto.facade import (
     parse_aviti,
     parse_aviti_from_data,
@@ -15,14 +17,18 @@ from elsheeto.models.illumina_v1 import IlluminaSampleSheet
 from elsheeto.parser.common import ParserConfiguration
 
 
+@pytest.fixture(scope="module")
+def illumina_v1_sheet(data_files: dict[str, str]) -> IlluminaSampleSheet:
+    """Illumina v1 example sheet, parsed once for all write tests."""
+    return parse_illumina_v1_from_data(data_files["illumina_v1/example1.csv"])
+
+
 class TestIlluminaV1Facade:
     """Test Illumina v1 facade functions."""
 
-    def test_parse_illumina_v1_from_data(self):
+    def test_parse_illumina_v1_from_data(self, data_files: dict[str, str]):
         """Test parsing Illumina v1 sample sheet from data."""
-        data_path = Path(__file__).parent.parent / "data" / "illumina_v1" / "example1.csv"
-        with open(data_path, "r", encoding="utf-8") as f:
-            data = f.read()
+        data = data_files["illumina_v1/example1.csv"]
 
         result = parse_illumina_v1_from_data(data)
 
@@ -30,14 +36,13 @@ class TestIlluminaV1Facade:
         assert result.header is not None
         assert len(result.data) > 0
 
-    def test_parse_illumina_v1_from_data_with_config(self):
+    def test_parse_illumina_v1_from_data_with_config(
+        self, data_files: dict[str, str], parser_config: ParserConfiguration
+    ):
         """Test parsing Illumina v1 sample sheet from data with config."""
-        data_path = Path(__file__).parent.parent / "data" / "illumina_v1" / "example1.csv"
-        with open(data_path, "r", encoding="utf-8") as f:
-            data = f.read()
+        data = data_files["illumina_v1/example1.csv"]
 
-        config = ParserConfiguration()
-        result = parse_illumina_v1_from_data(data, config=config)
+        result = parse_illumina_v1_from_data(data, config=parser_config)
 
         assert isinstance(result, IlluminaSampleSheet)
         assert result.header is not None
@@ -53,35 +58,29 @@ class TestIlluminaV1Facade:
         assert result.header is not None
         assert len(result.data) > 0
 
-    def test_parse_illumina_v1_from_file_with_config(self):
+    def test_parse_illumina_v1_from_file_with_config(self, parser_config: ParserConfiguration):
         """Test parsing Illumina v1 sample sheet from file path with config."""
         data_path = Path(__file__).parent.parent / "data" / "illumina_v1" / "example1.csv"
 
-        config = ParserConfiguration()
-        result = parse_illumina_v1(str(data_path), config=config)
+        result = parse_illumina_v1(str(data_path), config=parser_config)
 
         assert isinstance(result, IlluminaSampleSheet)
         assert result.header is not None
         assert len(result.data) > 0
 
-    def test_write_illumina_v1_to_string(self):
+    def test_write_illumina_v1_to_string(self, illumina_v1_sheet: IlluminaSampleSheet):
         """Test writing Illumina v1 sample sheet to string."""
-        data_path = Path(__file__).parent.parent / "data" / "illumina_v1" / "example1.csv"
-        parsed_sheet = parse_illumina_v1(str(data_path))
-
-        result = write_illumina_v1_to_string(parsed_sheet)
+        result = write_illumina_v1_to_string(illumina_v1_sheet)
 
         assert isinstance(result, str)
         assert "[Header]" in result
         assert "[Data]" in result
 
-    def test_write_illumina_v1_to_file(self, tmp_path):
+    def test_write_illumina_v1_to_file(self, illumina_v1_sheet: IlluminaSampleSheet, tmp_path):
         """Test writing Illumina v1 sample sheet to file."""
-        data_path = Path(__file__).parent.parent / "data" / "illumina_v1" / "example1.csv"
-        parsed_sheet = parse_illumina_v1(str(data_path))
         output_file = tmp_path / "test_output.csv"
 
-        write_illumina_v1_to_file(parsed_sheet, str(output_file))
+        write_illumina_v1_to_file(illumina_v1_sheet, str(output_file))
 
         assert output_file.exists()
         content = output_file.read_text()
@@ -92,25 +91,20 @@ class TestIlluminaV1Facade:
 class TestAvitiFacade:
     """Test Aviti facade functions."""
 
-    def test_parse_aviti_from_data(self):
+    def test_parse_aviti_from_data(self, data_files: dict[str, str]):
         """Test parsing Aviti sample sheet from data."""
-        data_path = Path(__file__).parent.parent / "data" / "aviti" / "example1.csv"
-        with open(data_path, "r", encoding="utf-8") as f:
-            data = f.read()
+        data = data_files["aviti/example1.csv"]
 
         result = parse_aviti_from_data(data)
 
         assert isinstance(result, AvitiSheet)
         assert len(result.samples) > 0
 
-    def test_parse_aviti_from_data_with_config(self):
+    def test_parse_aviti_from_data_with_config(self, data_files: dict[str, str], parser_config: ParserConfiguration):
         """Test parsing Aviti sample sheet from data with config."""
-        data_path = Path(__file__).parent.parent / "data" / "aviti" / "example1.csv"
-        with open(data_path, "r", encoding="utf-8") as f:
-            data = f.read()
+        data = data_files["aviti/example1.csv"]
 
-        config = ParserConfiguration()
-        result = parse_aviti_from_data(data, config=config)
+        result = parse_aviti_from_data(data, config=parser_config)
 
         assert isinstance(result, AvitiSheet)
         assert len(result.samples) > 0
@@ -124,12 +118,11 @@ class TestAvitiFacade:
         assert isinstance(result, AvitiSheet)
         assert len(result.samples) > 0
 
-    def test_parse_aviti_from_file_with_config(self):
+    def test_parse_aviti_from_file_with_config(self, parser_config: ParserConfiguration):
         """Test parsing Aviti sample sheet from file path with config."""
         data_path = Path(__file__).parent.parent / "data" / "aviti" / "example1.csv"
 
-        config = ParserConfiguration()
-        result = parse_aviti(str(data_path), config=config)
+        result = parse_aviti(str(data_path), config=parser_config)
 
         assert isinstance(result, AvitiSheet)
         assert len(result.samples) > 0
@@ -13,95 +13,59 @@ from elsheeto.models.aviti import (
 )
 from elsheeto.models.utils import CaseInsensitiveDict
 
+#: Sample shared by the read-only `TestAvitiSheet` tests.
+_SAMPLE1 = AvitiSample.model_construct(sample_name="Sample1", index1="ATGC", index2="TCGA")
+
 
 class TestAvitiSample:
     """Test AvitiSample model validation."""
 
-    def test_valid_sample_basic(self):
-        """Test creating a valid basic sample."""
-        sample = AvitiSample(
-            sample_name="Sample1",
-            index1="ATGC",
-            index2="TCGA",
-        )
-        assert sample.sample_name == "Sample1"
-        assert sample.index1 == "ATGC"
-        assert sample.index2 == "TCGA"
-
-    def test_valid_sample_with_empty_index2(self):
-        """Test creating a valid sample with empty index2."""
+    @pytest.mark.parametrize(
+        "index1,index2",
+        [
+            ("ATGC", "TCGA"),
+            ("ATGC", ""),
+            ("ATGC+TCGA", "CCGG+TTAA"),
+        ],
+        ids=["basic", "empty_index2", "composite_indices"],
+    )
+    def test_valid_sample(self, index1: str, index2: str):
+        """Test creating valid samples."""
         sample = AvitiSample(
             sample_name="Sample1",
-            index1="ATGC",
-            index2="",
-        )
-        assert sample.sample_name == "Sample1"
-        assert sample.index1 == "ATGC"
-        assert sample.index2 == ""
-
-    def test_valid_sample_composite_indices(self):
-        """Test creating a valid sample with composite indices."""
-        sample = AvitiSample(
-            sample_name="Sample1",
-            index1="ATGC+TCGA",
-            index2="CCGG+TTAA",
+            index1=index1,
+            index2=index2,
         )
         assert sample.sample_name == "Sample1"
-        assert sample.index1 == "ATGC+TCGA"
-        assert sample.index2 == "CCGG+TTAA"
-
-    def test_invalid_index1_empty(self):
-        """Test that empty index1 raises validation error."""
-        with pytest.raises(ValidationError, match="Index1 cannot be empty"):
+        assert sample.index1 == index1
+        assert sample.index2 == index2
+
+    @pytest.mark.parametrize(
+        "index1,index2,message",
+        [
+            ("", "TCGA", "Index1 cannot be empty"),
+            ("   ", "TCGA", "Index1 cannot be empty"),
+            ("ATGC++TCGA", "CCGG", "Index parts cannot be empty"),
+            ("ATGC@INVALID", "TCGA", "Invalid characters in index"),
+            ("ATGC", "CCGG++TTAA", "Index parts cannot be empty"),
+            ("ATGC", "TCGA!INVALID", "Invalid characters in index"),
+        ],
+        ids=[
+            "index1_empty",
+            "index1_whitespace_only",
+            "index1_empty_part_in_composite",
+            "index1_special_characters",
+            "index2_empty_part_in_composite",
+            "index2_special_characters",
+        ],
+    )
+    def test_invalid_sample(self, index1: str, index2: str, message: str):
+        """Test that invalid indices raise validation errors."""
+        with pytest.raises(ValidationError, match=message):
             AvitiSample(
                 sample_name="Sample1",
-                index1="",
-                index2="TCGA",
-            )
-
-    def test_invalid_index1_whitespace_only(self):
-        """Test that whitespace-only index1 raises validation error."""
-        with pytest.raises(ValidationError, match="Index1 cannot be empty"):
-            AvitiSample(
-                sample_name="Sample1",
-                index1="   ",
-                index2="TCGA",
-            )
-
-    def test_invalid_index1_empty_part_in_composite(self):
-        """Test that empty part in composite index1 raises validation error."""
-        with pytest.raises(ValidationError, match="Index parts cannot be empty"):
-            AvitiSample(
-                sample_name="Sample1",
-                index1="ATGC++TCGA",
-                index2="CCGG",
-            )
-
-    def test_invalid_index1_special_characters(self):
-        """Test that invalid characters in index1 raise validation error."""
-        with pytest.raises(ValidationError, match="Invalid characters in index"):
-            AvitiSample(
-                sample_name="Sample1",
-                index1="ATGC@INVALID",
-                index2="TCGA",
-            )
-
-    def test_invalid_index2_empty_part_in_composite(self):
-        """Test that empty part in composite index2 raises validation error."""
-        with pytest.raises(ValidationError, match="Index parts cannot be empty"):
-            AvitiSample(
-                sample_name="Sample1",
-                index1="ATGC",
-                index2="CCGG++TTAA",
-            )
-
-    def test_invalid_index2_special_characters(self):
-        """Test that invalid characters in index2 raise validation error."""
-        with pytest.raises(ValidationError, match="Invalid characters in index"):
-            AvitiSample(
-                sample_name="Sample1",
-                index1="ATGC",
-                index2="TCGA!INVALID",
+                index1=index1,
+                index2=index2,
             )
 
     def test_valid_sample_with_all_fields(self):
@@ -321,12 +285,15 @@ class TestAvitiSettingEntries:
 
 
 class TestAvitiSheet:
-    """Test AvitiSheet model."""
+    """Test AvitiSheet model.
+
+    Samples are only inputs here, so they are built with ``model_construct()``;
+    their validation is covered by ``TestAvitiSample``.
+    """
 
     def test_minimal_aviti_sheet(self):
         """Test creating minimal Aviti sheet."""
-        sample = AvitiSample(sample_name="Sample1", index1="ATGC", index2="TCGA")
-        sheet = AvitiSheet(samples=[sample])
+        sheet = AvitiSheet(samples=[_SAMPLE1])
 
         assert sheet.run_values is None
         assert sheet.settings is None
@@ -335,7 +302,6 @@ class TestAvitiSheet:
 
     def test_complete_aviti_sheet(self):
         """Test creating complete Aviti sheet."""
-        sample = AvitiSample(sample_name="Sample1", index1="ATGC", index2="TCGA")
         run_values = AvitiRunValues(data=CaseInsensitiveDict({"RunId": "Run123"}))
         settings = AvitiSettings(
             settings=AvitiSettingEntries(entries=[AvitiSettingEntry(name="R1Adapter", value="ATGC")])
@@ -344,7 +310,7 @@ class TestAvitiSheet:
         sheet = AvitiSheet(
             run_values=run_values,
             settings=settings,
-            samples=[sample],
+            samples=[_SAMPLE1],
         )
 
         assert sheet.run_values is not None
@@ -1,5 +1,7 @@
 """Unit tests for csv_stage2 models."""
 
+import pytest
+
 from elsheeto.models.csv_stage2 import HeaderSection
 
 
@@ -23,50 +25,52 @@ class TestHeaderSection:
         assert section.name == "header"
         assert section.rows == rows
 
-    def test_key_values_property_two_column_rows(self):
-        """Test key_values property extracts key-value pairs correctly from 2-column rows."""
-        rows = [
-            ["IEMFileVersion", "4"],
-            ["Investigator Name", "John Doe"],
-            ["EmptyValue", ""],  # Should be excluded (empty value)
-            ["", "EmptyKey"],  # Should be excluded (empty key)
-            ["151"],  # Should be excluded (not 2 non-empty cells)
-            ["Setting", "Value", "Lane"],  # Should be excluded (3 non-empty cells)
-        ]
+    @pytest.mark.parametrize(
+        "rows,expected",
+        [
+            (
+                [
+                    ["IEMFileVersion", "4"],
+                    ["Investigator Name", "John Doe"],
+                    ["EmptyValue", ""],  # Should be excluded (empty value)
+                    ["", "EmptyKey"],  # Should be excluded (empty key)
+                    ["151"],  # Should be excluded (not 2 non-empty cells)
+                    ["Setting", "Value", "Lane"],  # Should be excluded (3 non-empty cells)
+                ],
+                {"IEMFileVersion": "4", "Investigator Name": "John Doe"},
+            ),
+            ([], {}),
+            (
+                [
+                    ["151"],  # Single value
+                    ["Setting", "Value", "Lane"],  # Three values
+                    ["", ""],  # Empty row
+                ],
+                {},
+            ),
+            (
+                [
+                    ["  IEMFileVersion  ", "  4  "],
+                    ["Investigator Name", "John Doe"],
+                    ["  ", "  "],  # Should be excluded (whitespace only)
+                ],
+                {"IEMFileVersion": "4", "Investigator Name": "John Doe"},
+            ),
+        ],
+        ids=["two_column_rows", "empty_section", "no_valid_pairs", "with_whitespace"],
+    )
+    def test_key_values_property(self, rows: list[list[str]], expected: dict[str, str]):
+        """Test key_values property only extracts rows with exactly two non-empty cells."""
         section = HeaderSection(name="header", rows=rows)
-
-        expected = {
-            "IEMFileVersion": "4",
-            "Investigator Name": "John Doe",
-        }
         assert section.key_values == expected
 
-    def test_key_values_property_empty_section(self):
-        """Test key_values property with empty section."""
-        section = HeaderSection(name="header", rows=[])
-        assert section.key_values == {}
-
-    def test_key_values_property_no_valid_pairs(self):
-        """Test key_values property when no rows form valid key-value pairs."""
-        rows = [
-            ["151"],  # Single value
-            ["Setting", "Value", "Lane"],  # Three values
-            ["", ""],  # Empty row
-        ]
-        section = HeaderSection(name="header", rows=rows)
-        assert section.key_values == {}
+    def test_key_values_follow_copied_rows(self):
+        """Test key_values reflects the rows of a copy with updated rows."""
+        section = HeaderSection(name="header", rows=[["IEMFileVersion", "4"]])
+        assert section.key_values == {"IEMFileVersion": "4"}
 
-    def test_key_values_property_with_whitespace(self):
-        """Test key_values property handles whitespace correctly."""
-        rows = [
-            ["  IEMFileVersion  ", "  4  "],
-            ["Investigator Name", "John Doe"],
-            ["  ", "  "],  # Should be excluded (whitespace only)
-        ]
-        section = HeaderSection(name="header", rows=rows)
+        copied = section.model_copy(update={"rows": [["IEMFileVersion", "5"]]})
 
-        expected = {
-            "IEMFileVersion": "4",
-            "Investigator Name": "John Doe",
-        }
-        assert section.key_values == expected
+        assert copied.key_values == {"IEMFileVersion": "5"}
+        assert section.key_values == {"IEMFileVersion": "4"}
+        assert section.model_dump() == {"name": "header", "rows": [["IEMFileVersion", "4"]]}
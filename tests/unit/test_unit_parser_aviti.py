@@ -2,40 +2,52 @@
 
 import pytest
 
-from elsheeto.models.aviti import AvitiSheet
-from elsheeto.models.common import ParsedSheetType
-from elsheeto.models.csv_stage2 import (
-    DataSection,
-    HeaderSection,
-    ParsedSheet,
+from elsheeto.models.aviti import (
+    AvitiSettingEntries,
+    AvitiSettingEntry,
+    AvitiSettings,
+    AvitiSheet,
 )
+from elsheeto.models.csv_stage2 import HeaderSection
 from elsheeto.parser.aviti import Parser, from_stage2
 from elsheeto.parser.common import ParserConfiguration
 
+from sheet_helpers import create_data_section, create_parsed_sheet
 
-def _create_data_section(headers: list[str] | None = None, data: list[list[str]] | None = None) -> DataSection:
-    """Helper to create a valid DataSection."""
-    headers = headers or []
-    data = data or []
-    header_to_index = {header: idx for idx, header in enumerate(headers)}
-    return DataSection(headers=headers, header_to_index=header_to_index, data=data)
-
-
-def _create_parsed_sheet(
-    header_sections: list[HeaderSection] | None = None,
-    data_section: DataSection | None = None,
-    delimiter: str = ",",
-    sheet_type: ParsedSheetType = ParsedSheetType.SECTIONED,
-) -> ParsedSheet:
-    """Helper to create a valid ParsedSheet."""
-    header_sections = header_sections or []
-    data_section = data_section or _create_data_section()
-    return ParsedSheet(
-        delimiter=delimiter,
-        sheet_type=sheet_type,
-        header_sections=header_sections,
-        data_section=data_section,
-    )
+
+@pytest.fixture(scope="module")
+def parser(parser_config: ParserConfiguration) -> Parser:
+    """Parser with default configuration, shared by all tests in this module."""
+    return Parser(parser_config)
+
+
+#: Default read 1 adapter sequence.
+_R1_ADAPTER = "CGTGCTGGATTGGCTCACCAGACACCTTCCGACAT"
+#: Default read 2 adapter sequence.
+_R2_ADAPTER = "AGTTGACAAGCGGTAGCCTGCACACCTTCCGACAT"
+
+#: Settings section with the default read adapters, shared by read-only tests.
+_SETTINGS_SECTION = HeaderSection.model_construct(
+    name="settings",
+    rows=[
+        ["R1Adapter", _R1_ADAPTER],
+        ["R2Adapter", _R2_ADAPTER],
+    ],
+)
+
+#: Data section with a single minimal sample, shared by read-only tests.
+_MINIMAL_DATA_SECTION = create_data_section(
+    headers=["SampleName", "Index1", "Index2"],
+    data=[["Sample1", "ATGC", "TCGA"]],
+)
+
+#: Sheet with only an unrelated header section, shared by the "no section" tests.
+_NO_SECTION_SHEET = create_parsed_sheet(
+    header_sections=[HeaderSection.model_construct(name="header", rows=[["SampleName", "Sample1"], ["Index1", "ATGC"]])]
+)
+
+#: Sheet without any header sections or sample data.
+_EMPTY_SHEET = create_parsed_sheet()
 
 
 class TestParserInit:
@@ -51,12 +63,9 @@ class TestParserInit:
 class TestParseRunValues:
     """Test RunValues parsing functionality."""
 
-    def test_parse_run_values_basic(self):
+    def test_parse_run_values_basic(self, parser: Parser):
         """Test parsing basic RunValues section."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        run_values_section = HeaderSection(
+        run_values_section = HeaderSection.model_construct(
             name="runvalues",
             rows=[
                 ["KeyName", "SomeKey"],
@@ -65,7 +74,7 @@ class TestParseRunValues:
             ],
         )
 
-        parsed_sheet = _create_parsed_sheet(header_sections=[run_values_section])
+        parsed_sheet = create_parsed_sheet(header_sections=[run_values_section])
 
         run_values = parser._parse_run_values(parsed_sheet)
 
@@ -76,16 +85,9 @@ class TestParseRunValues:
             "Experiment": "Test_Experiment",
         }
 
-    def test_parse_run_values_no_section(self):
+    def test_parse_run_values_no_section(self, parser: Parser):
         """Test parsing when no RunValues section is present."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        header_section = HeaderSection(name="header", rows=[["SomeOtherKey", "SomeValue"]])
-
-        parsed_sheet = _create_parsed_sheet(header_sections=[header_section])
-
-        run_values = parser._parse_run_values(parsed_sheet)
+        run_values = parser._parse_run_values(_NO_SECTION_SHEET)
 
         assert run_values is None
 
@@ -93,35 +95,21 @@ class TestParseRunValues:
 class TestParseSettings:
     """Test Settings parsing functionality."""
 
-    def test_parse_settings_basic(self):
+    def test_parse_settings_basic(self, parser: Parser):
         """Test parsing basic Settings section."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        settings_section = HeaderSection(
-            name="settings",
-            rows=[
-                ["R1Adapter", "CGTGCTGGATTGGCTCACCAGACACCTTCCGACAT"],
-                ["R2Adapter", "AGTTGACAAGCGGTAGCCTGCACACCTTCCGACAT"],
-            ],
-        )
-
-        parsed_sheet = _create_parsed_sheet(header_sections=[settings_section])
+        parsed_sheet = create_parsed_sheet(header_sections=[_SETTINGS_SECTION])
 
         settings = parser._parse_settings(parsed_sheet)
 
         assert settings is not None
         assert settings.data == {
-            "R1Adapter": "CGTGCTGGATTGGCTCACCAGACACCTTCCGACAT",
-            "R2Adapter": "AGTTGACAAGCGGTAGCCTGCACACCTTCCGACAT",
+            "R1Adapter": _R1_ADAPTER,
+            "R2Adapter": _R2_ADAPTER,
         }
 
-    def test_parse_settings_lane_specific(self):
+    def test_parse_settings_lane_specific(self, parser: Parser):
         """Test parsing lane-specific Settings section with 3-column structure."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        settings_section = HeaderSection(
+        settings_section = HeaderSection.model_construct(
             name="settings",
             rows=[
                 ["SettingName", "Value", "Lane"],  # Header row (should be skipped)
@@ -132,7 +120,7 @@ class TestParseSettings:
             ],
         )
 
-        parsed_sheet = _create_parsed_sheet(header_sections=[settings_section])
+        parsed_sheet = create_parsed_sheet(header_sections=[settings_section])
 
         settings = parser._parse_settings(parsed_sheet)
 
@@ -159,39 +147,22 @@ class TestParseSettings:
         assert len(no_lane_settings) == 1
         assert no_lane_settings["SpikeInAsUnassigned"] == "FALSE"
 
-    def test_parse_settings_no_section(self):
+    def test_parse_settings_no_section(self, parser: Parser):
         """Test parsing when no Settings section is present."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        # Use a section that would be detected as samples-related
-        header_section = HeaderSection(
-            name="header",
-            rows=[
-                ["SampleName", "Sample1"],
-                ["Index1", "ATGC"],
-            ],
-        )
-
-        parsed_sheet = _create_parsed_sheet(header_sections=[header_section])
-
-        settings = parser._parse_settings(parsed_sheet)
+        settings = parser._parse_settings(_NO_SECTION_SHEET)
 
         assert settings is None
 
-    def test_parse_settings_too_many_columns_error(self):
+    def test_parse_settings_too_many_columns_error(self, parser: Parser):
         """Test that settings with more than 3 columns raise an error."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        settings_section = HeaderSection(
+        settings_section = HeaderSection.model_construct(
             name="settings",
             rows=[
                 ["R1Adapter", "ATGCATGC", "1+2", "ExtraColumn"],  # Too many columns - actual setting data
             ],
         )
 
-        parsed_sheet = _create_parsed_sheet(header_sections=[settings_section])
+        parsed_sheet = create_parsed_sheet(header_sections=[settings_section])
 
         with pytest.raises(ValueError, match="Invalid Aviti settings row: found 4 non-empty fields"):
             parser._parse_settings(parsed_sheet)
@@ -200,298 +171,267 @@ class TestParseSettings:
 class TestParseSamples:
     """Test samples parsing functionality."""
 
-    def test_parse_samples_basic(self):
-        """Test parsing basic sample data."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        data_section = _create_data_section(
-            headers=["SampleName", "Index1", "Index2", "Lane", "Project"],
-            data=[
-                ["Sample_1", "CCC", "AAA", "1", "Library_Pool_1"],
-                ["Sample_2", "TTT", "GGG", "1", "Library_Pool_1"],
-            ],
-        )
-
-        parsed_sheet = _create_parsed_sheet(data_section=data_section)
-
-        samples = parser._parse_samples(parsed_sheet)
-
-        assert len(samples) == 2
-
-        sample1 = samples[0]
-        assert sample1.sample_name == "Sample_1"
-        assert sample1.index1 == "CCC"
-        assert sample1.index2 == "AAA"
-        assert sample1.lane == "1"
-        assert sample1.project == "Library_Pool_1"
-
-        sample2 = samples[1]
-        assert sample2.sample_name == "Sample_2"
-        assert sample2.index1 == "TTT"
-        assert sample2.index2 == "GGG"
-        assert sample2.lane == "1"
-        assert sample2.project == "Library_Pool_1"
-
-    def test_parse_samples_minimal(self):
-        """Test parsing minimal sample data (required fields only)."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        data_section = _create_data_section(
-            headers=["SampleName", "Index1", "Index2"],
-            data=[
-                ["Sample1", "AGGCAGAA", "TGCTACGA"],
-                ["Sample2", "CGTTCTCTTG", "CACCAAGTGG"],
-            ],
-        )
-
-        parsed_sheet = _create_parsed_sheet(data_section=data_section)
-
-        samples = parser._parse_samples(parsed_sheet)
-
-        assert len(samples) == 2
-
-        sample1 = samples[0]
-        assert sample1.sample_name == "Sample1"
-        assert sample1.index1 == "AGGCAGAA"
-        assert sample1.index2 == "TGCTACGA"
-        assert sample1.lane is None
-        assert sample1.project is None
-
-    def test_parse_samples_with_extra_metadata(self):
-        """Test parsing samples with unknown columns stored as extra metadata."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        data_section = _create_data_section(
-            headers=["SampleName", "Index1", "Index2", "Custom_Metadata"],
-            data=[
-                ["Sample_1", "CCC", "", "Sample_1_metadata"],
-            ],
-        )
-
-        parsed_sheet = _create_parsed_sheet(data_section=data_section)
-
-        samples = parser._parse_samples(parsed_sheet)
-
-        assert len(samples) == 1
-        sample = samples[0]
-        assert sample.sample_name == "Sample_1"
-        assert sample.index1 == "CCC"
-        assert sample.index2 == ""
-        assert sample.extra_metadata == {"Custom_Metadata": "Sample_1_metadata"}
-
-    def test_parse_samples_composite_indices(self):
-        """Test parsing samples with composite indices."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        data_section = _create_data_section(
-            headers=["SampleName", "Index1", "Index2"],
-            data=[
-                ["Sample1", "ATGC+TCGA", "CCGG+TTAA"],
-            ],
-        )
-
-        parsed_sheet = _create_parsed_sheet(data_section=data_section)
-
-        samples = parser._parse_samples(parsed_sheet)
-
-        assert len(samples) == 1
-        sample = samples[0]
-        assert sample.sample_name == "Sample1"
-        assert sample.index1 == "ATGC+TCGA"
-        assert sample.index2 == "CCGG+TTAA"
-
-    def test_parse_samples_empty_values(self):
-        """Test parsing samples with empty values."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        data_section = _create_data_section(
-            headers=["SampleName", "Index1", "Index2", "Lane", "Project"],
-            data=[
-                ["Sample1", "ATGC", "", "", ""],
-                ["Sample2", "TCGA", "CCGG", "2", ""],
-            ],
-        )
-
-        parsed_sheet = _create_parsed_sheet(data_section=data_section)
+    @pytest.mark.parametrize(
+        "headers,data,expected",
+        [
+            (
+                ["SampleName", "Index1", "Index2", "Lane", "Project"],
+                [
+                    ["Sample_1", "CCC", "AAA", "1", "Library_Pool_1"],
+                    ["Sample_2", "TTT", "GGG", "1", "Library_Pool_1"],
+                ],
+                [
+                    {
+                        "sample_name": "Sample_1",
+                        "index1": "CCC",
+                        "index2": "AAA",
+                        "lane": "1",
+                        "project": "Library_Pool_1",
+                    },
+                    {
+                        "sample_name": "Sample_2",
+                        "index1": "TTT",
+                        "index2": "GGG",
+                        "lane": "1",
+                        "project": "Library_Pool_1",
+                    },
+                ],
+            ),
+            (
+                ["SampleName", "Index1", "Index2"],
+                [
+                    ["Sample1", "AGGCAGAA", "TGCTACGA"],
+                    ["Sample2", "CGTTCTCTTG", "CACCAAGTGG"],
+                ],
+                [
+                    {
+                        "sample_name": "Sample1",
+                        "index1": "AGGCAGAA",
+                        "index2": "TGCTACGA",
+                        "lane": None,
+                        "project": None,
+                    },
+                    {
+                        "sample_name": "Sample2",
+                        "index1": "CGTTCTCTTG",
+                        "index2": "CACCAAGTGG",
+                    },
+                ],
+            ),
+            (
+                ["SampleName", "Index1", "Index2", "Custom_Metadata"],
+                [
+                    ["Sample_1", "CCC", "", "Sample_1_metadata"],
+                ],
+                [
+                    {
+                        "sample_name": "Sample_1",
+                        "index1": "CCC",
+                        "index2": "",
+                        "extra_metadata": {"Custom_Metadata": "Sample_1_metadata"},
+                    },
+                ],
+            ),
+            (
+                ["SampleName", "Index1", "Index2"],
+                [
+                    ["Sample1", "ATGC+TCGA", "CCGG+TTAA"],
+                ],
+                [
+                    {
+                        "sample_name": "Sample1",
+                        "index1": "ATGC+TCGA",
+                        "index2": "CCGG+TTAA",
+                    },
+                ],
+            ),
+            (
+                ["SampleName", "Index1", "Index2", "Lane", "Project"],
+                [
+                    ["Sample1", "ATGC", "", "", ""],
+                    ["Sample2", "TCGA", "CCGG", "2", ""],
+                ],
+                [
+                    {
+                        "sample_name": "Sample1",
+                        "index1": "ATGC",
+                        "index2": "",
+                        "lane": None,
+                        "project": None,
+                    },
+                    {
+                        "sample_name": "Sample2",
+                        "index1": "TCGA",
+                        "index2": "CCGG",
+                        "lane": "2",
+                        "project": None,
+                    },
+                ],
+            ),
+            (
+                ["SampleName", "Index1"],
+                [
+                    ["Sample1", "ATGC", "ExtraValue1", "ExtraValue2"],  # More values than headers
+                ],
+                [
+                    {
+                        "sample_name": "Sample1",
+                        "index1": "ATGC",
+                        "index2": "",  # Missing Index2 defaults to empty string
+                    },
+                ],
+            ),
+            (
+                ["SampleName", "Index1", "Index2", "Lane"],
+                [
+                    ["Sample1", "ATGC", "TCGA", "   "],  # Whitespace-only lane
+                ],
+                [
+                    {
+                        "sample_name": "Sample1",
+                        "index1": "ATGC",
+                        "index2": "TCGA",
+                        "lane": None,  # Whitespace-only normalized to None
+                    },
+                ],
+            ),
+        ],
+        ids=[
+            "basic",
+            "minimal",
+            "with_extra_metadata",
+            "composite_indices",
+            "empty_values",
+            "more_values_than_headers",
+            "whitespace_normalization",
+        ],
+    )
+    def test_parse_samples(
+        self, parser: Parser, headers: list[str], data: list[list[str]], expected: list[dict[str, object]]
+    ):
+        """Test parsing sample data into the expected sample fields."""
+        parsed_sheet = create_parsed_sheet(data_section=create_data_section(headers=headers, data=data))
 
         samples = parser._parse_samples(parsed_sheet)
 
-        assert len(samples) == 2
+        assert len(samples) == len(expected)
+        for sample, expected_fields in zip(samples, expected, strict=True):
+            for field, value in expected_fields.items():
+                assert getattr(sample, field) == value
 
-        sample1 = samples[0]
-        assert sample1.sample_name == "Sample1"
-        assert sample1.index1 == "ATGC"
-        assert sample1.index2 == ""
-        assert sample1.lane is None
-        assert sample1.project is None
-
-        sample2 = samples[1]
-        assert sample2.sample_name == "Sample2"
-        assert sample2.index1 == "TCGA"
-        assert sample2.index2 == "CCGG"
-        assert sample2.lane == "2"
-        assert sample2.project is None
-
-    def test_parse_samples_no_data(self):
+    def test_parse_samples_no_data(self, parser: Parser):
         """Test parsing when samples section is empty."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        data_section = _create_data_section()
-
-        parsed_sheet = _create_parsed_sheet(data_section=data_section)
-
-        samples = parser._parse_samples(parsed_sheet)
+        samples = parser._parse_samples(_EMPTY_SHEET)
 
         assert samples == []
 
-    def test_parse_samples_missing_sample_name(self):
+    def test_parse_samples_missing_sample_name(self, parser: Parser):
         """Test parsing fails when required SampleName is missing."""
-        config = ParserConfiguration()
-        parser = Parser(config)
+        data_section = create_data_section(headers=["Index1", "Index2"], data=[["ATGC", "TCGA"]])
 
-        data_section = _create_data_section(headers=["Index1", "Index2"], data=[["ATGC", "TCGA"]])
-
-        parsed_sheet = _create_parsed_sheet(data_section=data_section)
+        parsed_sheet = create_parsed_sheet(data_section=data_section)
 
         with pytest.raises(ValueError, match="Missing required SampleName"):
             parser._parse_samples(parsed_sheet)
 
-    def test_parse_samples_missing_index1(self):
+    def test_parse_samples_missing_index1(self, parser: Parser):
         """Test parsing fails when required Index1 is missing."""
-        config = ParserConfiguration()
-        parser = Parser(config)
+        data_section = create_data_section(headers=["SampleName", "Index2"], data=[["Sample1", "TCGA"]])
 
-        data_section = _create_data_section(headers=["SampleName", "Index2"], data=[["Sample1", "TCGA"]])
-
-        parsed_sheet = _create_parsed_sheet(data_section=data_section)
+        parsed_sheet = create_parsed_sheet(data_section=data_section)
 
         with pytest.raises(ValueError, match="Missing required Index1"):
             parser._parse_samples(parsed_sheet)
 
-    def test_parse_samples_more_values_than_headers(self):
-        """Test parsing samples where a row has more values than headers."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        data_section = _create_data_section(
-            headers=["SampleName", "Index1"],
-            data=[
-                ["Sample1", "ATGC", "ExtraValue1", "ExtraValue2"],  # More values than headers
-            ],
-        )
-
-        parsed_sheet = _create_parsed_sheet(data_section=data_section)
-
-        samples = parser._parse_samples(parsed_sheet)
-
-        assert len(samples) == 1
-        sample = samples[0]
-        assert sample.sample_name == "Sample1"
-        assert sample.index1 == "ATGC"
-        assert sample.index2 == ""  # Missing Index2 defaults to empty string
 
-    def test_parse_samples_whitespace_normalization(self):
-        """Test parsing samples with whitespace-only values that get normalized to None."""
-        config = ParserConfiguration()
-        parser = Parser(config)
+@pytest.mark.perf
+class TestParseSamplesBenchmark:
+    """Micro-benchmarks for sample parsing, run with `-m perf`."""
 
-        data_section = _create_data_section(
-            headers=["SampleName", "Index1", "Index2", "Lane"],
-            data=[
-                ["Sample1", "ATGC", "TCGA", "   "],  # Whitespace-only lane
-            ],
+    @pytest.mark.benchmark(group="parser-aviti")
+    def test_bench_parse_samples(self, parser: Parser, benchmark):
+        """Benchmark parsing of a large synthetic samples section."""
+        data_section = create_data_section(
+            headers=["SampleName", "Index1", "Index2", "Lane", "Project"],
+            data=[[f"Sample{i}", "ATGC", "TCGA", "1", "Project1"] for i in range(10_000)],
         )
+        parsed_sheet = create_parsed_sheet(data_section=data_section)
 
-        parsed_sheet = _create_parsed_sheet(data_section=data_section)
-
-        samples = parser._parse_samples(parsed_sheet)
+        samples = benchmark(parser._parse_samples, parsed_sheet)
 
-        assert len(samples) == 1
-        sample = samples[0]
-        assert sample.sample_name == "Sample1"
-        assert sample.index1 == "ATGC"
-        assert sample.index2 == "TCGA"
-        assert sample.lane is None  # Whitespace-only normalized to None
+        assert len(samples) == 10_000
 
 
-class TestParseComplete:
-    """Test complete parsing functionality."""
-
-    def test_parse_sheet_full(self):
-        """Test parsing a complete Aviti sample sheet."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        settings_section = HeaderSection(
-            name="settings",
-            rows=[
-                ["R1Adapter", "CGTGCTGGATTGGCTCACCAGACACCTTCCGACAT"],
-                ["R2Adapter", "AGTTGACAAGCGGTAGCCTGCACACCTTCCGACAT"],
-            ],
-        )
-
-        data_section = _create_data_section(
+#: Complete parsing scenarios as `(header_sections, data_section, expected)`.
+_COMPLETE_SCENARIOS = {
+    "full": (
+        [_SETTINGS_SECTION],
+        create_data_section(
             headers=["SampleName", "Index1", "Index2"],
             data=[
                 ["Sample1", "AGGCAGAA", "TGCTACGA"],
                 ["Sample2", "CGTTCTCTTG", "CACCAAGTGG"],
             ],
-        )
+        ),
+        {
+            "settings": AvitiSettings(
+                settings=AvitiSettingEntries(
+                    entries=[
+                        AvitiSettingEntry(name="R1Adapter", value=_R1_ADAPTER),
+                        AvitiSettingEntry(name="R2Adapter", value=_R2_ADAPTER),
+                    ]
+                )
+            ),
+            "sample_names": ["Sample1", "Sample2"],
+        },
+    ),
+    "minimal": (
+        [],
+        _MINIMAL_DATA_SECTION,
+        {"settings": None, "sample_names": ["Sample1"]},
+    ),
+}
+
+
+@pytest.fixture(scope="class", params=list(_COMPLETE_SCENARIOS))
+def aviti_scenario(request: pytest.FixtureRequest, parser: Parser) -> tuple[AvitiSheet, dict]:
+    """Aviti sheet parsed once per scenario, together with the expected values."""
+    header_sections, data_section, expected = _COMPLETE_SCENARIOS[request.param]
+    parsed_sheet = create_parsed_sheet(header_sections=header_sections, data_section=data_section)
+    return parser.parse(parsed_sheet=parsed_sheet), expected
+
 
-        parsed_sheet = _create_parsed_sheet(header_sections=[settings_section], data_section=data_section)
+class TestParseComplete:
+    """Test complete parsing functionality."""
 
-        aviti_sheet = parser.parse(parsed_sheet=parsed_sheet)
+    def test_parse_returns_aviti_sheet(self, aviti_scenario: tuple[AvitiSheet, dict]):
+        """Test parsing returns an Aviti sheet without run values."""
+        aviti_sheet, _ = aviti_scenario
 
         assert isinstance(aviti_sheet, AvitiSheet)
         assert aviti_sheet.run_values is None
-        assert aviti_sheet.settings is not None
-        assert aviti_sheet.settings.data["R1Adapter"] == "CGTGCTGGATTGGCTCACCAGACACCTTCCGACAT"
-        assert len(aviti_sheet.samples) == 2
-        assert aviti_sheet.samples[0].sample_name == "Sample1"
-        assert aviti_sheet.samples[1].sample_name == "Sample2"
 
-    def test_parse_minimal_aviti_sheet(self):
-        """Test parsing a minimal Aviti sample sheet."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        data_section = _create_data_section(
-            headers=["SampleName", "Index1", "Index2"],
-            data=[["Sample1", "ATGC", "TCGA"]],
-        )
+    def test_parse_settings(self, aviti_scenario: tuple[AvitiSheet, dict]):
+        """Test all settings are parsed, and that they are absent without a settings section."""
+        aviti_sheet, expected = aviti_scenario
 
-        parsed_sheet = _create_parsed_sheet(data_section=data_section)
+        assert aviti_sheet.settings == expected["settings"]
 
-        aviti_sheet = parser.parse(parsed_sheet=parsed_sheet)
+    def test_parse_samples(self, aviti_scenario: tuple[AvitiSheet, dict]):
+        """Test all samples are parsed in order."""
+        aviti_sheet, expected = aviti_scenario
 
-        assert isinstance(aviti_sheet, AvitiSheet)
-        assert aviti_sheet.run_values is None
-        assert aviti_sheet.settings is None
-        assert len(aviti_sheet.samples) == 1
-        assert aviti_sheet.samples[0].sample_name == "Sample1"
+        assert [sample.sample_name for sample in aviti_sheet.samples] == expected["sample_names"]
 
 
 class TestParseFunctionInterface:
     """Test the module-level parse function."""
 
-    def test_parse_function(self):
+    def test_parse_function(self, parser_config: ParserConfiguration):
         """Test the module-level parse function."""
-        config = ParserConfiguration()
-
-        data_section = _create_data_section(
-            headers=["SampleName", "Index1", "Index2"],
-            data=[["Sample1", "ATGC", "TCGA"]],
-        )
-
-        parsed_sheet = _create_parsed_sheet(data_section=data_section)
+        parsed_sheet = create_parsed_sheet(data_section=_MINIMAL_DATA_SECTION)
 
-        aviti_sheet = from_stage2(parsed_sheet=parsed_sheet, config=config)
+        aviti_sheet = from_stage2(parsed_sheet=parsed_sheet, config=parser_config)
 
         assert isinstance(aviti_sheet, AvitiSheet)
         assert len(aviti_sheet.samples) == 1
@@ -2,629 +2,453 @@
 
 import pytest
 
-from elsheeto.models.common import ParsedSheetType
 from elsheeto.models.csv_stage2 import (
-    DataSection,
     HeaderSection,
     ParsedSheet,
 )
 from elsheeto.models.illumina_v1 import (
+    IlluminaHeader,
+    IlluminaReads,
+    IlluminaSample,
     IlluminaSampleSheet,
 )
 from elsheeto.parser.common import ParserConfiguration
 from elsheeto.parser.illumina_v1 import Parser, from_stage2
 
+from sheet_helpers import create_data_section, create_parsed_sheet
 
-def _create_data_section(headers: list[str] | None = None, data: list[list[str]] | None = None) -> DataSection:
-    """Helper to create a valid DataSection."""
-    headers = headers or []
-    data = data or []
-    header_to_index = {header: idx for idx, header in enumerate(headers)}
-    return DataSection(headers=headers, header_to_index=header_to_index, data=data)
-
-
-def _create_parsed_sheet(
-    header_sections: list[HeaderSection] | None = None,
-    data_section: DataSection | None = None,
-    delimiter: str = ",",
-    sheet_type: ParsedSheetType = ParsedSheetType.SECTIONED,
-) -> ParsedSheet:
-    """Helper to create a valid ParsedSheet."""
-    header_sections = header_sections or []
-    data_section = data_section or _create_data_section()
-    return ParsedSheet(
-        delimiter=delimiter,
-        sheet_type=sheet_type,
-        header_sections=header_sections,
-        data_section=data_section,
-    )
 
+def _make_rows(n: int, template: list[str], id_col: int = 0) -> list[list[str]]:
+    """Helper to build `n` data rows from `template` with a unique sample ID in column `id_col`."""
+    return [[f"S{i}" if j == id_col else value for j, value in enumerate(template)] for i in range(n)]
 
-class TestParserInit:
-    """Test parser initialization."""
 
-    def test_init_with_config(self):
-        """Test parser initialization with configuration."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-        assert parser.config is config
+#: File version header row shared by many tests.
+_IEM_ROW = ["IEMFileVersion", "4"]
+#: Investigator header row shared by many tests.
+_DOE_ROW = ["Investigator Name", "John Doe"]
 
+#: Header section with only the file version and investigator, shared by read-only tests.
+_HEADER_SECTION = HeaderSection.model_construct(name="header", rows=[_IEM_ROW, _DOE_ROW])
 
-class TestParseHeader:
-    """Test header parsing functionality."""
+#: Reads section with a single 151bp read, shared by read-only tests.
+_READS_151_SECTION = HeaderSection.model_construct(name="reads", rows=[["151", ""]])
 
-    def test_parse_header_basic(self):
-        """Test parsing basic header information."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        header_section = HeaderSection(
-            name="header",
-            rows=[
-                ["IEMFileVersion", "4"],
-                ["Investigator Name", "John Doe"],
-                ["Experiment Name", "Test Experiment"],
-                ["Date", "2023-01-01"],
-                ["Workflow", "GenerateFASTQ"],
-                ["Application", "FASTQ Only"],
-                ["Instrument Type", "MiSeq"],
-                ["Assay", "TruSeq HT"],
-                ["Index Adapters", "TruSeq HT"],
-                ["Description", "Test description"],
-                ["Chemistry", "Amplicon"],
-            ],
-        )
-
-        parsed_sheet = _create_parsed_sheet(header_sections=[header_section])
-
-        header = parser._parse_header(parsed_sheet)
-
-        assert header.iem_file_version == "4"
-        assert header.investigator_name == "John Doe"
-        assert header.experiment_name == "Test Experiment"
-        assert header.date == "2023-01-01"
-        assert header.workflow == "GenerateFASTQ"
-        assert header.application == "FASTQ Only"
-        assert header.instrument_type == "MiSeq"
-        assert header.assay == "TruSeq HT"
-        assert header.index_adapters == "TruSeq HT"
-        assert header.description == "Test description"
-        assert header.chemistry == "Amplicon"
-
-    def test_parse_header_case_insensitive(self):
-        """Test that header parsing is case-insensitive."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        header_section = HeaderSection(
-            name="header",
-            rows=[
-                ["iemfileversion", "4"],
-                ["INVESTIGATOR NAME", "Jane Smith"],
-                ["experiment name", "Mixed Case Test"],
-            ],
-        )
+#: Expected result of parsing the complete sample sheet.
+_EXPECTED_COMPLETE = IlluminaSampleSheet(
+    header=IlluminaHeader(
+        iem_file_version="4",
+        investigator_name="John Doe",
+        experiment_name="Test Experiment",
+        date="2023-01-01",
+        workflow="GenerateFASTQ",
+    ),
+    reads=IlluminaReads(read_lengths=[151]),
+    settings=None,
+    data=[
+        IlluminaSample(sample_id="Sample1", sample_name="Sample One", i7_index_id="N701", index="TAAGGCGA"),
+        IlluminaSample(sample_id="Sample2", sample_name="Sample Two", i7_index_id="N702", index="CGTACTAG"),
+    ],
+)
 
-        parsed_sheet = _create_parsed_sheet(header_sections=[header_section])
+#: Expected result of parsing the minimal sample sheet.
+_EXPECTED_MINIMAL = IlluminaSampleSheet(
+    header=IlluminaHeader(iem_file_version="4"),
+    reads=None,
+    settings=None,
+    data=[IlluminaSample(sample_id="Sample1")],
+)
 
-        header = parser._parse_header(parsed_sheet)
 
-        assert header.iem_file_version == "4"
-        assert header.investigator_name == "Jane Smith"
-        assert header.experiment_name == "Mixed Case Test"
+class TestParserInit:
+    """Test parser initialization."""
 
-    def test_parse_header_with_extra_metadata(self):
-        """Test parsing header with unknown fields stored as extra metadata."""
+    def test_init_with_config(self):
+        """Test parser initialization with configuration."""
         config = ParserConfiguration()
         parser = Parser(config)
+        assert parser.config is config
 
-        header_section = HeaderSection(
-            name="header",
-            rows=[
-                ["IEMFileVersion", "4"],
-                ["Investigator Name", "John Doe"],
-                ["Custom Field", "Custom Value"],
-                ["Another Field", "Another Value"],
-            ],
-        )
-
-        parsed_sheet = _create_parsed_sheet(header_sections=[header_section])
-
-        header = parser._parse_header(parsed_sheet)
-
-        assert header.iem_file_version == "4"
-        assert header.investigator_name == "John Doe"
-        assert header.extra_metadata == {
-            "Custom Field": "Custom Value",
-            "Another Field": "Another Value",
-        }
 
-    def test_parse_header_multiple_sections(self):
-        """Test parsing header from multiple header sections."""
-        config = ParserConfiguration()
-        parser = Parser(config)
+class TestParseHeader:
+    """Test header parsing functionality."""
 
-        header_sections = [
-            HeaderSection(
-                name="header",
-                rows=[
-                    ["IEMFileVersion", "4"],
-                    ["Investigator Name", "John Doe"],
-                    ["Experiment Name", "Test Experiment"],
-                    ["Date", "2023-01-01"],
+    @pytest.mark.parametrize(
+        "header_sections,expected",
+        [
+            (
+                [
+                    HeaderSection.model_construct(
+                        name="header",
+                        rows=[
+                            _IEM_ROW,
+                            _DOE_ROW,
+                            ["Experiment Name", "Test Experiment"],
+                            ["Date", "2023-01-01"],
+                            ["Workflow", "GenerateFASTQ"],
+                            ["Application", "FASTQ Only"],
+                            ["Instrument Type", "MiSeq"],
+                            ["Assay", "TruSeq HT"],
+                            ["Index Adapters", "TruSeq HT"],
+                            ["Description", "Test description"],
+                            ["Chemistry", "Amplicon"],
+                        ],
+                    )
                 ],
+                {
+                    "iem_file_version": "4",
+                    "investigator_name": "John Doe",
+                    "experiment_name": "Test Experiment",
+                    "date": "2023-01-01",
+                    "workflow": "GenerateFASTQ",
+                    "application": "FASTQ Only",
+                    "instrument_type": "MiSeq",
+                    "assay": "TruSeq HT",
+                    "index_adapters": "TruSeq HT",
+                    "description": "Test description",
+                    "chemistry": "Amplicon",
+                },
             ),
-        ]
-
-        parsed_sheet = _create_parsed_sheet(header_sections=header_sections)
-
-        header = parser._parse_header(parsed_sheet)
-
-        assert header.iem_file_version == "4"
-        assert header.investigator_name == "John Doe"
-        assert header.experiment_name == "Test Experiment"
-        assert header.date == "2023-01-01"
-
-    def test_parse_header_no_header_section(self):
-        """Test parsing when no header section is present."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        # Create parsed sheet without any header section
-        parsed_sheet = _create_parsed_sheet(header_sections=[])
+            (
+                [
+                    HeaderSection.model_construct(
+                        name="header",
+                        rows=[
+                            ["iemfileversion", "4"],
+                            ["INVESTIGATOR NAME", "Jane Smith"],
+                            ["experiment name", "Mixed Case Test"],
+                        ],
+                    )
+                ],
+                {"iem_file_version": "4", "investigator_name": "Jane Smith", "experiment_name": "Mixed Case Test"},
+            ),
+            (
+                [
+                    HeaderSection.model_construct(
+                        name="header",
+                        rows=[
+                            _IEM_ROW,
+                            _DOE_ROW,
+                            ["Custom Field", "Custom Value"],
+                            ["Another Field", "Another Value"],
+                        ],
+                    )
+                ],
+                {
+                    "iem_file_version": "4",
+                    "investigator_name": "John Doe",
+                    "extra_metadata": {"Custom Field": "Custom Value", "Another Field": "Another Value"},
+                },
+            ),
+            (
+                [
+                    HeaderSection.model_construct(
+                        name="header",
+                        rows=[
+                            _IEM_ROW,
+                            _DOE_ROW,
+                            ["Experiment Name", "Test Experiment"],
+                            ["Date", "2023-01-01"],
+                        ],
+                    ),
+                ],
+                {
+                    "iem_file_version": "4",
+                    "investigator_name": "John Doe",
+                    "experiment_name": "Test Experiment",
+                    "date": "2023-01-01",
+                },
+            ),
+            # Without a header section, a minimal header with defaults is created
+            (
+                [],
+                {
+                    "iem_file_version": None,
+                    "investigator_name": None,
+                    "experiment_name": None,
+                    "date": None,
+                    "workflow": "GenerateFASTQ",
+                    "application": None,
+                    "instrument_type": None,
+                    "assay": None,
+                    "index_adapters": None,
+                    "description": None,
+                    "chemistry": None,
+                    "run": None,
+                    "extra_metadata": {},
+                },
+            ),
+        ],
+        ids=["basic", "case_insensitive", "extra_metadata", "multiple_sections", "no_section"],
+    )
+    def test_parse_header(
+        self, illumina_v1_parser: Parser, header_sections: list[HeaderSection], expected: dict[str, object]
+    ):
+        """Test parsing header sections into the expected header fields."""
+        parsed_sheet = create_parsed_sheet(header_sections=header_sections)
 
-        header = parser._parse_header(parsed_sheet)
+        header = illumina_v1_parser._parse_header(parsed_sheet)
 
-        # Should create minimal header with defaults
-        assert header.iem_file_version is None
-        assert header.investigator_name is None
-        assert header.experiment_name is None
-        assert header.date is None
-        assert header.workflow == "GenerateFASTQ"
-        assert header.application is None
-        assert header.instrument_type is None
-        assert header.assay is None
-        assert header.index_adapters is None
-        assert header.description is None
-        assert header.chemistry is None
-        assert header.run is None
-        assert header.extra_metadata == {}
+        assert {field: getattr(header, field) for field in expected} == expected
 
 
 class TestParseReads:
     """Test reads parsing functionality."""
 
-    def test_parse_reads_single_read(self):
-        """Test parsing single read length."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        reads_section = HeaderSection(name="reads", rows=[["151", ""]])
-
-        parsed_sheet = _create_parsed_sheet(header_sections=[reads_section])
-
-        reads = parser._parse_reads(parsed_sheet)
-
-        assert reads is not None
-        assert reads.read_lengths == [151]
-
-    def test_parse_reads_paired_end(self):
-        """Test parsing paired-end read lengths."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        reads_section = HeaderSection(name="reads", rows=[["151", ""], ["151", ""]])
-
-        parsed_sheet = _create_parsed_sheet(header_sections=[reads_section])
-
-        reads = parser._parse_reads(parsed_sheet)
-
-        assert reads is not None
-        assert reads.read_lengths == [151, 151]
-
-    def test_parse_reads_no_reads_section(self):
-        """Test parsing when no reads section is present."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        header_section = HeaderSection(
-            name="header",
-            rows=[
-                ["IEMFileVersion", "4"],
-                ["Investigator Name", "John Doe"],
-            ],
-        )
-
-        parsed_sheet = _create_parsed_sheet(header_sections=[header_section])
-
-        reads = parser._parse_reads(parsed_sheet)
-
-        assert reads is None
-
-    def test_parse_reads_invalid_row_format(self):
-        """Test parsing reads section with invalid row format (non-empty key and value)."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        reads_section = HeaderSection(
-            name="reads",
-            rows=[
-                ["151", ""],  # Valid row
-                ["SomeKey", "SomeValue"],  # Invalid row (not empty, not key-only)
-            ],
-        )
-
-        parsed_sheet = _create_parsed_sheet(header_sections=[reads_section])
-
-        reads = parser._parse_reads(parsed_sheet)
-
-        # Should return None due to invalid row format
-        assert reads is None
-
-    def test_parse_reads_invalid_numeric_value(self):
-        """Test parsing reads section with non-numeric value."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        reads_section = HeaderSection(
-            name="reads",
-            rows=[
-                ["abc", ""],  # Invalid non-numeric key
-            ],
-        )
-
-        parsed_sheet = _create_parsed_sheet(header_sections=[reads_section])
-
-        reads = parser._parse_reads(parsed_sheet)
-
-        # Should return None due to non-numeric value
-        assert reads is None
-
-    def test_parse_reads_empty_reads_section(self):
-        """Test parsing empty reads section (no rows)."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        reads_section = HeaderSection(name="reads", rows=[])
-
-        parsed_sheet = _create_parsed_sheet(header_sections=[reads_section])
+    @pytest.mark.parametrize(
+        "header_sections,expected",
+        [
+            ([_READS_151_SECTION], [151]),
+            ([HeaderSection.model_construct(name="reads", rows=[["151", ""], ["151", ""]])], [151, 151]),
+            ([_HEADER_SECTION], None),
+            # Invalid row format (not empty, not key-only)
+            ([HeaderSection.model_construct(name="reads", rows=[["151", ""], ["SomeKey", "SomeValue"]])], None),
+            # Invalid non-numeric key
+            ([HeaderSection.model_construct(name="reads", rows=[["abc", ""]])], None),
+            ([HeaderSection.model_construct(name="reads", rows=[])], None),
+        ],
+        ids=[
+            "single_read",
+            "paired_end",
+            "no_reads_section",
+            "invalid_row_format",
+            "invalid_numeric_value",
+            "empty_reads_section",
+        ],
+    )
+    def test_parse_reads(
+        self, illumina_v1_parser: Parser, header_sections: list[HeaderSection], expected: list[int] | None
+    ):
+        """Test parsing read lengths, or None if the reads section is missing or invalid."""
+        parsed_sheet = create_parsed_sheet(header_sections=header_sections)
 
-        reads = parser._parse_reads(parsed_sheet)
+        reads = illumina_v1_parser._parse_reads(parsed_sheet)
 
-        # Should return None for empty reads section
-        assert reads is None
+        if expected is None:
+            assert reads is None
+        else:
+            assert reads is not None
+            assert reads.read_lengths == expected
 
 
 class TestParseSettings:
     """Test settings parsing functionality."""
 
-    def test_parse_settings_basic(self):
-        """Test parsing basic settings."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        settings_section = HeaderSection(
-            name="settings",
-            rows=[
-                ["SettingOption1", "Value1"],
-                ["ConfigParameter", "Value2"],
+    @pytest.mark.parametrize(
+        "header_sections",
+        [
+            [
+                HeaderSection.model_construct(
+                    name="settings",
+                    rows=[
+                        ["SettingOption1", "Value1"],
+                        ["ConfigParameter", "Value2"],
+                    ],
+                )
             ],
-        )
-
-        parsed_sheet = _create_parsed_sheet(header_sections=[settings_section])
+            [_HEADER_SECTION],
+        ],
+        ids=["basic", "no_settings_section"],
+    )
+    def test_parse_settings(self, illumina_v1_parser: Parser, header_sections: list[HeaderSection]):
+        """Test settings are ignored, with or without a settings section."""
+        parsed_sheet = create_parsed_sheet(header_sections=header_sections)
 
-        settings = parser._parse_settings(parsed_sheet)
+        settings = illumina_v1_parser._parse_settings(parsed_sheet)
 
         # Settings section is ignored per requirements
         assert settings is None
 
-    def test_parse_settings_no_settings_section(self):
-        """Test parsing when no settings section is present."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        header_section = HeaderSection(
-            name="header",
-            rows=[
-                ["IEMFileVersion", "4"],
-                ["Investigator Name", "John Doe"],
-            ],
-        )
-
-        parsed_sheet = _create_parsed_sheet(header_sections=[header_section])
-
-        settings = parser._parse_settings(parsed_sheet)
-
-        assert settings is None
-
 
 class TestParseData:
     """Test data parsing functionality."""
 
-    def test_parse_data_basic(self):
-        """Test parsing basic sample data."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        data_section = _create_data_section(
-            headers=["Lane", "Sample_ID", "Sample_Name", "Sample_Project"],
-            data=[
-                ["1", "Sample1", "Sample One", "Project1"],
-                ["2", "Sample2", "Sample Two", "Project2"],
-            ],
-        )
-
-        parsed_sheet = _create_parsed_sheet(data_section=data_section)
-
-        samples = parser._parse_data(parsed_sheet)
-
-        assert len(samples) == 2
-
-        sample1 = samples[0]
-        assert sample1.lane == 1
-        assert sample1.sample_id == "Sample1"
-        assert sample1.sample_name == "Sample One"
-        assert sample1.sample_project == "Project1"
-
-        sample2 = samples[1]
-        assert sample2.lane == 2
-        assert sample2.sample_id == "Sample2"
-        assert sample2.sample_name == "Sample Two"
-        assert sample2.sample_project == "Project2"
-
-    def test_parse_data_with_indices(self):
-        """Test parsing sample data with index information."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        data_section = _create_data_section(
-            headers=["Sample_ID", "Sample_Name", "I7_Index_ID", "index", "I5_Index_ID", "index2"],
-            data=[
-                ["Sample1", "Sample One", "N701", "TAAGGCGA", "S501", "TAGATCGC"],
-                ["Sample2", "Sample Two", "N702", "CGTACTAG", "S502", "CTCTCTAT"],
-            ],
-        )
-
-        parsed_sheet = _create_parsed_sheet(data_section=data_section)
-
-        samples = parser._parse_data(parsed_sheet)
-
-        assert len(samples) == 2
-
-        sample1 = samples[0]
-        assert sample1.sample_id == "Sample1"
-        assert sample1.i7_index_id == "N701"
-        assert sample1.index == "TAAGGCGA"
-        assert sample1.i5_index_id == "S501"
-        assert sample1.index2 == "TAGATCGC"
-
-    def test_parse_data_with_extra_metadata(self):
-        """Test parsing data with unknown columns stored as extra metadata."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        data_section = _create_data_section(
-            headers=["Sample_ID", "Sample_Name", "Custom_Field", "Another_Field"],
-            data=[
-                ["Sample1", "Sample One", "Custom Value", "Another Value"],
-            ],
-        )
-
-        parsed_sheet = _create_parsed_sheet(data_section=data_section)
-
-        samples = parser._parse_data(parsed_sheet)
-
-        assert len(samples) == 1
-        sample = samples[0]
-        assert sample.sample_id == "Sample1"
-        assert sample.sample_name == "Sample One"
-        assert sample.extra_metadata == {
-            "Custom_Field": "Custom Value",
-            "Another_Field": "Another Value",
-        }
-
-    def test_parse_data_empty_values(self):
-        """Test parsing data with empty values."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        data_section = _create_data_section(
+    @pytest.mark.parametrize(
+        "headers,data,expected",
+        [
+            (
+                ["Lane", "Sample_ID", "Sample_Name", "Sample_Project"],
+                [
+                    ["1", "Sample1", "Sample One", "Project1"],
+                    ["2", "Sample2", "Sample Two", "Project2"],
+                ],
+                [
+                    {"lane": 1, "sample_id": "Sample1", "sample_name": "Sample One", "sample_project": "Project1"},
+                    {"lane": 2, "sample_id": "Sample2", "sample_name": "Sample Two", "sample_project": "Project2"},
+                ],
+            ),
+            (
+                ["Sample_ID", "Sample_Name", "I7_Index_ID", "index", "I5_Index_ID", "index2"],
+                [
+                    ["Sample1", "Sample One", "N701", "TAAGGCGA", "S501", "TAGATCGC"],
+                    ["Sample2", "Sample Two", "N702", "CGTACTAG", "S502", "CTCTCTAT"],
+                ],
+                [
+                    {
+                        "sample_id": "Sample1",
+                        "i7_index_id": "N701",
+                        "index": "TAAGGCGA",
+                        "i5_index_id": "S501",
+                        "index2": "TAGATCGC",
+                    },
+                    {"sample_id": "Sample2"},
+                ],
+            ),
+            (
+                ["Sample_ID", "Sample_Name", "Custom_Field", "Another_Field"],
+                [
+                    ["Sample1", "Sample One", "Custom Value", "Another Value"],
+                ],
+                [
+                    {
+                        "sample_id": "Sample1",
+                        "sample_name": "Sample One",
+                        "extra_metadata": {"Custom_Field": "Custom Value", "Another_Field": "Another Value"},
+                    },
+                ],
+            ),
+            (
+                ["Lane", "Sample_ID"],
+                [["invalid", "Sample1"]],
+                [{"lane": None, "sample_id": "Sample1"}],
+            ),
+            (
+                ["Sample_ID", "Sample_Name"],
+                [
+                    ["Sample1", "Sample One", "ExtraValue1", "ExtraValue2"],  # More values than headers
+                ],
+                # Extra values are ignored (not stored in extra_metadata since they have no header)
+                [{"sample_id": "Sample1", "sample_name": "Sample One", "extra_metadata": {}}],
+            ),
+        ],
+        ids=["basic", "with_indices", "with_extra_metadata", "invalid_lane", "more_values_than_headers"],
+    )
+    def test_parse_data(
+        self, illumina_v1_parser: Parser, headers: list[str], data: list[list[str]], expected: list[dict[str, object]]
+    ):
+        """Test parsing sample data into the expected sample fields."""
+        parsed_sheet = create_parsed_sheet(data_section=create_data_section(headers=headers, data=data))
+
+        samples = illumina_v1_parser._parse_data(parsed_sheet)
+
+        assert len(samples) == len(expected)
+        for sample, expected_fields in zip(samples, expected, strict=True):
+            for field, value in expected_fields.items():
+                assert getattr(sample, field) == value
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [("", None), ("   ", None), ("\t\n", None), ("Sample One", "Sample One"), ("  Sample One  ", "Sample One")],
+        ids=["empty", "spaces", "tab_newline", "non_empty", "padded"],
+    )
+    def test_parse_data_value_normalization(self, illumina_v1_parser: Parser, value: str, expected: str | None):
+        """Test empty or whitespace-only values are normalized to None and others are stripped."""
+        data_section = create_data_section(
             headers=["Sample_ID", "Sample_Name", "Description"],
-            data=[
-                ["Sample1", "", ""],
-                ["Sample2", "Sample Two", ""],
-            ],
+            data=[["Sample1", value, value]],
         )
 
-        parsed_sheet = _create_parsed_sheet(data_section=data_section)
-
-        samples = parser._parse_data(parsed_sheet)
+        parsed_sheet = create_parsed_sheet(data_section=data_section)
 
-        assert len(samples) == 2
+        samples = illumina_v1_parser._parse_data(parsed_sheet)
 
-        sample1 = samples[0]
-        assert sample1.sample_id == "Sample1"
-        assert sample1.sample_name is None
-        assert sample1.description is None
-
-        sample2 = samples[1]
-        assert sample2.sample_id == "Sample2"
-        assert sample2.sample_name == "Sample Two"
-        assert sample2.description is None
+        assert len(samples) == 1
+        assert samples[0].sample_id == "Sample1"
+        assert samples[0].sample_name == expected
+        assert samples[0].description == expected
 
-    def test_parse_data_no_data(self):
+    def test_parse_data_no_data(self, illumina_v1_parser: Parser):
         """Test parsing when data section is empty."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        data_section = _create_data_section()
+        data_section = create_data_section()
 
-        parsed_sheet = _create_parsed_sheet(data_section=data_section)
+        parsed_sheet = create_parsed_sheet(data_section=data_section)
 
-        samples = parser._parse_data(parsed_sheet)
+        samples = illumina_v1_parser._parse_data(parsed_sheet)
 
         assert samples == []
 
-    def test_parse_data_missing_sample_id(self):
+    def test_parse_data_missing_sample_id(self, illumina_v1_parser: Parser):
         """Test parsing fails when required Sample_ID is missing."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        data_section = _create_data_section(
-            headers=["Sample_Name", "Sample_Project"], data=[["Sample One", "Project1"]]
-        )
+        data_section = create_data_section(headers=["Sample_Name", "Sample_Project"], data=[["Sample One", "Project1"]])
 
-        parsed_sheet = _create_parsed_sheet(data_section=data_section)
+        parsed_sheet = create_parsed_sheet(data_section=data_section)
 
         with pytest.raises(ValueError, match="Missing required Sample_ID"):
-            parser._parse_data(parsed_sheet)
-
-    def test_parse_data_invalid_lane(self):
-        """Test parsing with invalid lane value."""
-        config = ParserConfiguration()
-        parser = Parser(config)
+            illumina_v1_parser._parse_data(parsed_sheet)
 
-        data_section = _create_data_section(headers=["Lane", "Sample_ID"], data=[["invalid", "Sample1"]])
 
-        parsed_sheet = _create_parsed_sheet(data_section=data_section)
+@pytest.mark.perf
+class TestParseDataBenchmark:
+    """Micro-benchmarks for data parsing, run with `-m perf`."""
 
-        samples = parser._parse_data(parsed_sheet)
-
-        assert len(samples) == 1
-        assert samples[0].lane is None
-        assert samples[0].sample_id == "Sample1"
-
-    def test_parse_data_more_values_than_headers(self):
-        """Test parsing data where a row has more values than headers."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        data_section = _create_data_section(
-            headers=["Sample_ID", "Sample_Name"],
-            data=[
-                ["Sample1", "Sample One", "ExtraValue1", "ExtraValue2"],  # More values than headers
-            ],
-        )
-
-        parsed_sheet = _create_parsed_sheet(data_section=data_section)
-
-        samples = parser._parse_data(parsed_sheet)
-
-        assert len(samples) == 1
-        sample = samples[0]
-        assert sample.sample_id == "Sample1"
-        assert sample.sample_name == "Sample One"
-        # Extra values should be ignored (not stored in extra_metadata since they have no header)
-
-    def test_parse_data_empty_string_normalization(self):
-        """Test parsing data with empty string values that get normalized to None."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        data_section = _create_data_section(
-            headers=["Sample_ID", "Sample_Name", "Description"],
-            data=[
-                ["Sample1", "   ", "Some description"],  # Whitespace-only string that should become None
-            ],
+    @pytest.mark.benchmark(group="parser-illumina-v1")
+    def test_bench_parse_data_large(self, illumina_v1_parser: Parser, benchmark):
+        """Benchmark parsing of a large synthetic data section."""
+        data_section = create_data_section(
+            headers=["Sample_ID", "Sample_Name", "I7_Index_ID", "index"],
+            data=_make_rows(10_000, ["", "Sample One", "N701", "TAAGGCGA"]),
         )
+        parsed_sheet = create_parsed_sheet(data_section=data_section)
+
+        samples = benchmark(illumina_v1_parser._parse_data, parsed_sheet)
+
+        assert len(samples) == 10_000
+        assert samples[-1].sample_id == "S9999"
+
+
+@pytest.fixture(scope="module")
+def complete_parsed_sheet() -> ParsedSheet:
+    """Complete stage 2 sheet with header, reads and data sections, built once per module."""
+    header_section = HeaderSection.model_construct(
+        name="header",
+        rows=[
+            _IEM_ROW,
+            _DOE_ROW,
+            ["Experiment Name", "Test Experiment"],
+            ["Date", "2023-01-01"],
+            ["Workflow", "GenerateFASTQ"],
+        ],
+    )
+    data_section = create_data_section(
+        headers=["Sample_ID", "Sample_Name", "I7_Index_ID", "index"],
+        data=[
+            ["Sample1", "Sample One", "N701", "TAAGGCGA"],
+            ["Sample2", "Sample Two", "N702", "CGTACTAG"],
+        ],
+    )
+    return create_parsed_sheet(header_sections=[header_section, _READS_151_SECTION], data_section=data_section)
 
-        parsed_sheet = _create_parsed_sheet(data_section=data_section)
 
-        samples = parser._parse_data(parsed_sheet)
-
-        assert len(samples) == 1
-        sample = samples[0]
-        assert sample.sample_id == "Sample1"
-        assert sample.sample_name is None  # Whitespace-only string normalized to None
-        assert sample.description == "Some description"
+@pytest.fixture(scope="module")
+def minimal_parsed_sheet() -> ParsedSheet:
+    """Minimal stage 2 sheet with a single header row and sample, built once per module."""
+    header_section = HeaderSection.model_construct(name="header", rows=[_IEM_ROW])
+    data_section = create_data_section(headers=["Sample_ID"], data=[["Sample1"]])
+    return create_parsed_sheet(header_sections=[header_section], data_section=data_section)
 
 
 class TestParseComplete:
     """Test complete parsing functionality."""
 
-    def test_parse_complete_sample_sheet(self):
+    def test_parse_complete_sample_sheet(self, illumina_v1_parser: Parser, complete_parsed_sheet: ParsedSheet):
         """Test parsing a complete Illumina v1 sample sheet."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        header_section = HeaderSection(
-            name="header",
-            rows=[
-                ["IEMFileVersion", "4"],
-                ["Investigator Name", "John Doe"],
-                ["Experiment Name", "Test Experiment"],
-                ["Date", "2023-01-01"],
-                ["Workflow", "GenerateFASTQ"],
-            ],
-        )
-
-        reads_section = HeaderSection(name="reads", rows=[["151", ""]])
-
-        data_section = _create_data_section(
-            headers=["Sample_ID", "Sample_Name", "I7_Index_ID", "index"],
-            data=[
-                ["Sample1", "Sample One", "N701", "TAAGGCGA"],
-                ["Sample2", "Sample Two", "N702", "CGTACTAG"],
-            ],
-        )
-
-        parsed_sheet = _create_parsed_sheet(header_sections=[header_section, reads_section], data_section=data_section)
-
-        sample_sheet = parser.parse(parsed_sheet=parsed_sheet)
-
-        assert isinstance(sample_sheet, IlluminaSampleSheet)
-        assert sample_sheet.header.iem_file_version == "4"
-        assert sample_sheet.header.investigator_name == "John Doe"
-        assert sample_sheet.reads is not None
-        assert sample_sheet.reads.read_lengths == [151]  # Only one unique value
-        assert len(sample_sheet.data) == 2
-        assert sample_sheet.data[0].sample_id == "Sample1"
-        assert sample_sheet.data[1].sample_id == "Sample2"
+        assert illumina_v1_parser.parse(parsed_sheet=complete_parsed_sheet) == _EXPECTED_COMPLETE
 
-    def test_parse_minimal_sample_sheet(self):
+    def test_parse_minimal_sample_sheet(self, illumina_v1_parser: Parser, minimal_parsed_sheet: ParsedSheet):
         """Test parsing a minimal Illumina v1 sample sheet."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
-        header_section = HeaderSection(name="header", rows=[["IEMFileVersion", "4"]])
-
-        data_section = _create_data_section(headers=["Sample_ID"], data=[["Sample1"]])
-
-        parsed_sheet = _create_parsed_sheet(header_sections=[header_section], data_section=data_section)
-
-        sample_sheet = parser.parse(parsed_sheet=parsed_sheet)
-
-        assert isinstance(sample_sheet, IlluminaSampleSheet)
-        assert sample_sheet.header.iem_file_version == "4"
-        assert sample_sheet.reads is None
-        assert sample_sheet.settings is None
-        assert len(sample_sheet.data) == 1
-        assert sample_sheet.data[0].sample_id == "Sample1"
+        assert illumina_v1_parser.parse(parsed_sheet=minimal_parsed_sheet) == _EXPECTED_MINIMAL
 
 
 class TestParseFunctionInterface:
     """Test the module-level parse function."""
 
-    def test_parse_function(self):
+    def test_parse_function(self, parser_config: ParserConfiguration):
         """Test the module-level parse function."""
-        config = ParserConfiguration()
-
-        header_section = HeaderSection(
-            name="header",
-            rows=[
-                ["IEMFileVersion", "4"],
-                ["Investigator Name", "John Doe"],
-            ],
-        )
+        data_section = create_data_section(headers=["Sample_ID"], data=[["Sample1"]])
 
-        data_section = _create_data_section(headers=["Sample_ID"], data=[["Sample1"]])
+        parsed_sheet = create_parsed_sheet(header_sections=[_HEADER_SECTION], data_section=data_section)
 
-        parsed_sheet = _create_parsed_sheet(header_sections=[header_section], data_section=data_section)
-
-        sample_sheet = from_stage2(parsed_sheet=parsed_sheet, config=config)
-
-        assert isinstance(sample_sheet, IlluminaSampleSheet)
-        assert sample_sheet.header.iem_file_version == "4"
-        assert sample_sheet.header.investigator_name == "John Doe"
-        assert len(sample_sheet.data) == 1
-        assert sample_sheet.data[0].sample_id == "Sample1"
+        expected = _EXPECTED_MINIMAL.model_copy(
+            update={"header": IlluminaHeader(iem_file_version="4", investigator_name="John Doe")}
+        )
+        assert from_stage2(parsed_sheet=parsed_sheet, config=parser_config) == expected
@@ -16,7 +16,7 @@ from elsheeto.parser.common import (
     CsvDelimiter,
     ParserConfiguration,
 )
-from elsheeto.parser.stage1 import Parser, from_csv
+from elsheeto.parser.stage1 import SNIFF_SAMPLE_SIZE, Parser, from_csv
 
 
 class TestParser:
@@ -203,6 +203,34 @@ TestKey,TestValue
         result = parser.parse(data=semicolon_data)
         assert result.delimiter == ";"
 
+    def test_sniff_sample_is_bounded(self):
+        """Test that only the start of large data is used for sniffing the dialect."""
+        data = "[Data]\nSample_ID\tIndex\n" + "".join(f"S{i}\tACGT\n" for i in range(SNIFF_SAMPLE_SIZE // 8))
+        parser = Parser(ParserConfiguration())
+
+        sample = parser._sniff_sample(data)
+        result = parser.parse(data=data)
+
+        assert len(sample) <= SNIFF_SAMPLE_SIZE
+        assert sample.endswith("\n")
+        assert data.startswith(sample)
+        assert result.delimiter == "\t"
+        assert len(result.sections[0].data) == SNIFF_SAMPLE_SIZE // 8 + 1
+
+    def test_extract_data_rows_for_sniffing(self):
+        """Test that section headers, comments, and empty lines are dropped before sniffing."""
+        data = "[Header]\r\n// comment\r\nKey;Value\r\n\r\n[Data]\r\nA;B\r\n"
+        parser = Parser(ParserConfiguration(comment_prefixes=["//"]))
+
+        assert parser._extract_data_rows_for_sniffing(data) == "Key;Value\nA;B"
+
+    def test_extract_data_rows_for_sniffing_without_comment_prefixes(self):
+        """Test that "#" lines are still dropped before sniffing if no comment prefixes are configured."""
+        data = "[Header]\n# comment, with, commas\nKey;Value\n"
+        parser = Parser(ParserConfiguration(comment_prefixes=[]))
+
+        assert parser._extract_data_rows_for_sniffing(data) == "Key;Value"
+
     def test_column_consistency_strict_sectioned(self):
         """Test strict sectioned column consistency."""
         data = """[Section1]
@@ -681,12 +709,13 @@ class TestFromCsvFunctionSmokeTest:
             raise ValueError("Unexpected value type in idfn")
 
     @pytest.mark.parametrize("path,delim", args, ids=idfn)
-    def test_smoke_test(self, path: Path, delim: CsvDelimiter, snapshot_json: SnapshotAssertion):
+    def test_smoke_test(
+        self, path: Path, delim: CsvDelimiter, data_files: dict[str, str], snapshot_json: SnapshotAssertion
+    ):
         """Run smoke test for all CSV files."""
         # arrange
 
-        with path.open("r", encoding="utf-8") as f:
-            data = f.read()
+        data = data_files[path.relative_to(self.path_data).as_posix()]
         config = ParserConfiguration(delimiter=delim)
 
         # act
@@ -14,6 +14,19 @@ from elsheeto.models.csv_stage2 import ParsedSheet
 from elsheeto.parser.common import CsvDelimiter, ParserConfiguration
 from elsheeto.parser.stage2 import Parser, from_stage1
 
+#: Two-column data section shared by the tests that only need some data section.
+_DATA_SECTION = ParsedRawSection(name="data", num_columns=2, data=[["Col1", "Col2"], ["Val1", "Val2"]])
+#: Section with a single key/value row.
+_KEY_VALUE_SECTION = ParsedRawSection(name="header", num_columns=2, data=[["Key1", "Value1"]])
+#: Section without any rows.
+_EMPTY_SECTION = ParsedRawSection(name="empty", num_columns=0, data=[])
+
+
+@pytest.fixture(scope="module")
+def parser(parser_config: ParserConfiguration) -> Parser:
+    """Parser with default configuration, shared by all tests in this module."""
+    return Parser(parser_config)
+
 
 class TestParser:
     """Test cases for the stage2 Parser class."""
@@ -24,7 +37,7 @@ class TestParser:
         parser = Parser(config)
         assert parser.config == config
 
-    def test_parse_illumina_style_sectioned(self):
+    def test_parse_illumina_style_sectioned(self, parser: Parser):
         """Test parsing Illumina-style sectioned data."""
         # Create raw sheet with Header and Data sections
         raw_sheet = ParsedRawSheet(
@@ -52,8 +65,6 @@ class TestParser:
             ],
         )
 
-        config = ParserConfiguration()
-        parser = Parser(config)
         result = parser.parse(raw_sheet=raw_sheet)
 
         assert result.delimiter == ","
@@ -74,7 +85,7 @@ class TestParser:
         assert data.data[0] == ["S1", "Sample1", "Plate1", "A01"]
         assert data.header_to_index["Sample_ID"] == 0
 
-    def test_parse_aviti_style_sectioned(self):
+    def test_parse_aviti_style_sectioned(self, parser: Parser):
         """Test parsing Aviti-style sectioned data."""
         raw_sheet = ParsedRawSheet(
             delimiter=",",
@@ -92,8 +103,6 @@ class TestParser:
             ],
         )
 
-        config = ParserConfiguration()
-        parser = Parser(config)
         result = parser.parse(raw_sheet=raw_sheet)
 
         assert result.sheet_type == ParsedSheetType.SECTIONED
@@ -106,7 +115,7 @@ class TestParser:
         assert len(data.data) == 2
         assert data.data[0] == ["Sample_1", "CCC", "AAA", "1"]
 
-    def test_parse_sectionless(self):
+    def test_parse_sectionless(self, parser: Parser):
         """Test parsing sectionless CSV data."""
         raw_sheet = ParsedRawSheet(
             delimiter=",",
@@ -124,8 +133,6 @@ class TestParser:
             ],
         )
 
-        config = ParserConfiguration()
-        parser = Parser(config)
         result = parser.parse(raw_sheet=raw_sheet)
 
         assert result.sheet_type == ParsedSheetType.SECTIONLESS
@@ -137,7 +144,7 @@ class TestParser:
         assert data.headers == ["Sample_ID", "Sample_Name", "Project"]
         assert len(data.data) == 2
 
-    def test_parse_multiple_header_sections(self):
+    def test_parse_multiple_header_sections(self, parser: Parser):
         """Test parsing with multiple header sections."""
         raw_sheet = ParsedRawSheet(
             delimiter=",",
@@ -153,61 +160,43 @@ class TestParser:
                     num_columns=2,
                     data=[["Setting1", "Value1"], ["Setting2", "Value2"]],
                 ),
-                ParsedRawSection(
-                    name="data",
-                    num_columns=2,
-                    data=[["Col1", "Col2"], ["Val1", "Val2"]],
-                ),
+                _DATA_SECTION,
             ],
         )
 
-        config = ParserConfiguration()
-        parser = Parser(config)
         result = parser.parse(raw_sheet=raw_sheet)
 
         assert len(result.header_sections) == 2
         assert result.header_sections[0].key_values["IEMFileVersion"] == "5"
         assert result.header_sections[1].key_values["Setting1"] == "Value1"
 
-    def test_parse_empty_sections(self):
+    def test_parse_empty_sections(self, parser: Parser):
         """Test parsing with empty sections."""
         raw_sheet = ParsedRawSheet(
             delimiter=",",
             sheet_type=ParsedSheetType.SECTIONED,
             sections=[
-                ParsedRawSection(name="empty", num_columns=0, data=[]),
-                ParsedRawSection(
-                    name="data",
-                    num_columns=2,
-                    data=[["Col1", "Col2"], ["Val1", "Val2"]],
-                ),
+                _EMPTY_SECTION,
+                _DATA_SECTION,
             ],
         )
 
-        config = ParserConfiguration()
-        parser = Parser(config)
         result = parser.parse(raw_sheet=raw_sheet)
 
         # Empty sections should not create header sections
         assert len(result.header_sections) == 0
         assert result.data_section is not None
 
-    def test_parse_single_section_as_data(self):
+    def test_parse_single_section_as_data(self, parser: Parser):
         """Test parsing when only one section is present - it becomes data section."""
         raw_sheet = ParsedRawSheet(
             delimiter=",",
             sheet_type=ParsedSheetType.SECTIONED,
             sections=[
-                ParsedRawSection(
-                    name="header",
-                    num_columns=2,
-                    data=[["Key1", "Value1"]],
-                ),
+                _KEY_VALUE_SECTION,
             ],
         )
 
-        config = ParserConfiguration()
-        parser = Parser(config)
         result = parser.parse(raw_sheet=raw_sheet)
 
         # Single section becomes data section per new rules
@@ -215,7 +204,7 @@ class TestParser:
         assert result.data_section.headers == ["Key1", "Value1"]
         assert result.data_section.data == []
 
-    def test_case_sensitivity_headers(self):
+    def test_case_sensitivity_headers(self, parser: Parser):
         """Test that headers preserve original case."""
         raw_sheet = ParsedRawSheet(
             delimiter=",",
@@ -235,14 +224,12 @@ class TestParser:
         )
 
         # Stage 2 should preserve original case
-        config = ParserConfiguration()
-        parser = Parser(config)
         result = parser.parse(raw_sheet=raw_sheet)
 
         assert "KEY1" in result.header_sections[0].key_values
         assert result.data_section.headers == ["COL1", "COL2"]
 
-    def test_single_value_rows(self):
+    def test_single_value_rows(self, parser: Parser):
         """Test handling of single-value rows - single section becomes data section."""
         raw_sheet = ParsedRawSheet(
             delimiter=",",
@@ -256,8 +243,6 @@ class TestParser:
             ],
         )
 
-        config = ParserConfiguration()
-        parser = Parser(config)
         result = parser.parse(raw_sheet=raw_sheet)
 
         # Single section becomes data section per new rules
@@ -265,27 +250,17 @@ class TestParser:
         assert result.data_section.headers == ["150"]
         assert result.data_section.data == [["150"]]
 
-    def test_last_section_is_data(self):
+    def test_last_section_is_data(self, parser: Parser):
         """Test that only the last section is treated as data section."""
         raw_sheet = ParsedRawSheet(
             delimiter=",",
             sheet_type=ParsedSheetType.SECTIONED,
             sections=[
-                ParsedRawSection(
-                    name="header",
-                    num_columns=2,
-                    data=[["Key1", "Value1"]],
-                ),
-                ParsedRawSection(
-                    name="data",
-                    num_columns=2,
-                    data=[["Col1", "Col2"], ["Val1", "Val2"]],
-                ),
+                _KEY_VALUE_SECTION,
+                _DATA_SECTION,
             ],
         )
 
-        config = ParserConfiguration()
-        parser = Parser(config)
         result = parser.parse(raw_sheet=raw_sheet)
 
         # First section becomes header, last section becomes data
@@ -294,7 +269,7 @@ class TestParser:
         assert result.data_section.headers == ["Col1", "Col2"]
         assert result.data_section.data == [["Val1", "Val2"]]
 
-    def test_no_sections_creates_empty_data(self):
+    def test_no_sections_creates_empty_data(self, parser: Parser):
         """Test that no sections results in empty data section."""
         raw_sheet = ParsedRawSheet(
             delimiter=",",
@@ -302,8 +277,6 @@ class TestParser:
             sections=[],
         )
 
-        config = ParserConfiguration()
-        parser = Parser(config)
         result = parser.parse(raw_sheet=raw_sheet)
 
         # No sections should create empty data section
@@ -311,11 +284,8 @@ class TestParser:
         assert result.data_section.headers == []
         assert result.data_section.data == []
 
-    def test_convert_to_header_section(self):
+    def test_convert_to_header_section(self, parser: Parser):
         """Test header section conversion."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
         # Normal key-value pairs
         section = ParsedRawSection(
             name="header",
@@ -332,15 +302,11 @@ class TestParser:
         assert result.key_values["Key2"] == "Value2"
 
         # Empty section
-        empty_section = ParsedRawSection(name="empty", num_columns=0, data=[])
-        result = parser._convert_to_header_section(empty_section)
+        result = parser._convert_to_header_section(_EMPTY_SECTION)
         assert result is None
 
-    def test_convert_to_data_section(self):
+    def test_convert_to_data_section(self, parser: Parser):
         """Test data section conversion."""
-        config = ParserConfiguration()
-        parser = Parser(config)
-
         # Normal tabular data
         section = ParsedRawSection(
             name="data",
@@ -358,22 +324,17 @@ class TestParser:
         assert result.header_to_index["Col3"] == 2
 
         # Empty section
-        empty_section = ParsedRawSection(name="empty", num_columns=0, data=[])
-        result = parser._convert_to_data_section(empty_section)
+        result = parser._convert_to_data_section(_EMPTY_SECTION)
         assert result.headers == []
         assert result.data == []
 
-    def test_multiple_sections_first_is_header_last_is_data(self):
+    def test_multiple_sections_first_is_header_last_is_data(self, parser: Parser):
         """Test that with multiple sections, first becomes header and last becomes data."""
         raw_sheet = ParsedRawSheet(
             delimiter=",",
             sheet_type=ParsedSheetType.SECTIONED,
             sections=[
-                ParsedRawSection(
-                    name="data",
-                    num_columns=2,
-                    data=[["Col1", "Col2"], ["Val1", "Val2"]],
-                ),
+                _DATA_SECTION,
                 ParsedRawSection(
                     name="samples",
                     num_columns=2,
@@ -382,8 +343,6 @@ class TestParser:
             ],
         )
 
-        config = ParserConfiguration()
-        parser = Parser(config)
         result = parser.parse(raw_sheet=raw_sheet)
 
         # First section becomes header, last becomes data
@@ -393,7 +352,7 @@ class TestParser:
         assert result.data_section.headers == ["Sample", "Index"]
         assert result.data_section.data == [["S1", "AAA"]]
 
-    def test_multiple_sections_with_flexible_fields(self):
+    def test_multiple_sections_with_flexible_fields(self, parser: Parser):
         """Test that multiple sections work with flexible fields - first is header, last is data."""
         raw_sheet = ParsedRawSheet(
             delimiter=",",
@@ -417,8 +376,6 @@ class TestParser:
             ],
         )
 
-        config = ParserConfiguration()
-        parser = Parser(config)
         result = parser.parse(raw_sheet=raw_sheet)
 
         # First section becomes header
@@ -445,11 +402,7 @@ class TestParseFunction:
                     num_columns=2,
                     data=[["Key", "Value"]],
                 ),
-                ParsedRawSection(
-                    name="data",
-                    num_columns=2,
-                    data=[["Col1", "Col2"], ["Val1", "Val2"]],
-                ),
+                _DATA_SECTION,
             ],
         )
 
@@ -482,12 +435,13 @@ class TestFromStage1FunctionSmokeTest:
             raise ValueError("Unexpected value type in idfn")
 
     @pytest.mark.parametrize("path,delim", args, ids=idfn)
-    def test_smoke_test(self, path: Path, delim: CsvDelimiter, snapshot_json: SnapshotAssertion):
+    def test_smoke_test(
+        self, path: Path, delim: CsvDelimiter, data_files: dict[str, str], snapshot_json: SnapshotAssertion
+    ):
         """Run smoke test for all CSV files."""
         # arrange
 
-        with path.open("r", encoding="utf-8") as f:
-            data = f.read()
+        data = data_files[path.relative_to(self.path_data).as_posix()]
         config = ParserConfiguration(delimiter=delim)
         raw_sheet = parser_stage1.from_csv(data=data, config=config)
 